@@ -13,16 +13,23 @@ import argparse
 import os
 import re
 import sys
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List
 
+from odoo18_xml_scanner import find_files, read_bytes, read_text, scan_xml_file
+
+# Bytes of __manifest__.py checked for the version before reading the whole file
+MANIFEST_HEAD_SIZE = 4096
+
+MANIFEST_VERSION_RE = re.compile(rb'"version".*18\.0')
+
 
 class Odoo18CompatibilityValidator:
     """Validates Odoo modules for complete 18.0 compatibility"""
 
     def __init__(self, module_path: str):
         self.module_path = Path(module_path)
+        self.module_root = str(self.module_path)
         self.errors = []
         self.warnings = []
 
@@ -32,14 +39,10 @@ class Odoo18CompatibilityValidator:
 
         # Check all compatibility issues
         self._check_init_files()
-        self._check_view_elements()
-        self._check_view_modes()
-        self._check_deprecated_attributes()
+        self._check_xml_files()
         self._check_security_files()
         self._check_demo_data()
         self._check_model_inheritance()
-        self._check_search_domains()
-        self._check_calendar_attributes()
         self._check_field_dependencies()
         self._check_manifest_compatibility()
         self._check_business_logic_constraints()
@@ -60,44 +63,20 @@ class Odoo18CompatibilityValidator:
         if (self.module_path / "models").exists() and not models_init.exists():
             self.errors.append("Missing models/__init__.py file")
 
-    def _check_view_elements(self):
-        """Check for deprecated <tree> elements"""
-        for xml_file in self.module_path.rglob("*.xml"):
-            try:
-                content = xml_file.read_text()
-                if "<tree" in content:
-                    rel_path = xml_file.relative_to(self.module_path)
-                    self.errors.append(f"Deprecated <tree> element in {rel_path}")
-                if "</tree>" in content:
-                    rel_path = xml_file.relative_to(self.module_path)
-                    self.errors.append(f"Deprecated </tree> element in {rel_path}")
-            except Exception as e:
-                self.warnings.append(f"Could not read {xml_file}: {e}")
+    def _find(self, suffix: str) -> List[str]:
+        """Find files below the module path by name suffix, as plain path strings"""
+        return find_files(self.module_path, suffix)
 
-    def _check_view_modes(self):
-        """Check for deprecated 'tree' in view_mode"""
-        for xml_file in self.module_path.rglob("*.xml"):
-            try:
-                content = xml_file.read_text()
-                if re.search(r'view_mode.*tree', content):
-                    rel_path = xml_file.relative_to(self.module_path)
-                    self.errors.append(f"Deprecated 'tree' in view_mode in {rel_path}")
-            except Exception as e:
-                self.warnings.append(f"Could not read {xml_file}: {e}")
+    def _rel(self, path) -> str:
+        """Path relative to the module, by slicing off the module root prefix"""
+        return str(path)[len(self.module_root):].lstrip(os.sep)
 
-    def _check_deprecated_attributes(self):
-        """Check for deprecated attrs and states attributes"""
-        for xml_file in self.module_path.rglob("*.xml"):
-            try:
-                content = xml_file.read_text()
-                if 'attrs=' in content:
-                    self.errors.append(f"Deprecated 'attrs' attribute in {xml_file.relative_to(self.module_path)}")
-                if 'states=' in content and 'button' in content:
-                    self.errors.append(
-                        f"Deprecated 'states' attribute on button in {xml_file.relative_to(self.module_path)}"
-                    )
-            except Exception as e:
-                self.warnings.append(f"Could not read {xml_file}: {e}")
+    def _check_xml_files(self):
+        """Check all XML files for deprecated views, attributes and domains"""
+        for xml_file in self._find(".xml"):
+            errors, warnings = scan_xml_file(xml_file, self.module_root)
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
 
     def _check_security_files(self):
         """Check security file consistency"""
@@ -105,31 +84,32 @@ class Odoo18CompatibilityValidator:
         if security_dir.exists():
             for csv_file in security_dir.glob("*.csv"):
                 try:
-                    content = csv_file.read_text()
+                    content = read_text(csv_file)
                     # Check for common security issues
                     if "model_sale_order" in content and self._is_inherited_model("sale.order"):
                         self.warnings.append(
-                            f"Unnecessary access rights for inherited model in {csv_file.relative_to(self.module_path)}"
+                            f"Unnecessary access rights for inherited model in {self._rel(csv_file)}"
                         )
                 except Exception as e:
                     self.warnings.append(f"Could not read {csv_file}: {e}")
 
     def _check_demo_data(self):
         """Check demo data for required field references"""
+        # Imported here so that --help and modules without demo data don't pay for it
+        import xml.etree.ElementTree as ET
+
         data_dir = self.module_path / "data"
         if data_dir.exists():
             for xml_file in data_dir.glob("*demo*.xml"):
                 try:
-                    tree = ET.parse(xml_file)
-                    root = tree.getroot()
+                    root = ET.fromstring(read_bytes(xml_file))
 
-                    # Check for records without required fields
-                    for record in root.findall(".//record"):
-                        model = record.get("model")
-                        if model and self._has_required_fields(model):
-                            self.warnings.append(
-                                f"Demo data in {xml_file.relative_to(self.module_path)} should include required fields"
-                            )
+                    # Check for records without required fields; one warning per file is enough
+                    models = {record.get("model") for record in root.iter("record")}
+                    if any(model and self._has_required_fields(model) for model in models):
+                        self.warnings.append(
+                            f"Demo data in {self._rel(xml_file)} should include required fields"
+                        )
 
                 except Exception as e:
                     self.warnings.append(f"Could not parse demo data {xml_file}: {e}")
@@ -140,52 +120,26 @@ class Odoo18CompatibilityValidator:
         if models_dir.exists():
             for py_file in models_dir.glob("*.py"):
                 try:
-                    content = py_file.read_text()
+                    content = read_text(py_file)
                     if "mail.thread" in content and "_inherit" not in content:
                         self.warnings.append(
-                            f"Model using mail.thread should use _inherit in {py_file.relative_to(self.module_path)}"
+                            f"Model using mail.thread should use _inherit in {self._rel(py_file)}"
                         )
                 except Exception as e:
                     self.warnings.append(f"Could not read {py_file}: {e}")
 
-    def _check_search_domains(self):
-        """Check for problematic search domains"""
-        for xml_file in self.module_path.rglob("*.xml"):
-            try:
-                content = xml_file.read_text()
-                if "timedelta" in content and "domain=" in content:
-                    self.errors.append(
-                        f"Problematic timedelta usage in search domain in {xml_file.relative_to(self.module_path)}"
-                    )
-                if "context_today" in content and "timedelta" in content:
-                    self.errors.append(f"Context timedelta issue in {xml_file.relative_to(self.module_path)}")
-            except Exception as e:
-                self.warnings.append(f"Could not read {xml_file}: {e}")
-
-    def _check_calendar_attributes(self):
-        """Check for deprecated calendar attributes"""
-        for xml_file in self.module_path.rglob("*.xml"):
-            try:
-                content = xml_file.read_text()
-                if "quick_add=" in content and "<calendar" in content:
-                    self.errors.append(
-                        f"Deprecated 'quick_add' attribute in calendar view in {xml_file.relative_to(self.module_path)}"
-                    )
-            except Exception as e:
-                self.warnings.append(f"Could not read {xml_file}: {e}")
-
     def _check_field_dependencies(self):
         """Check for missing field dependencies"""
         models_dir = self.module_path / "models"
         if models_dir.exists():
             for py_file in models_dir.glob("*.py"):
                 try:
-                    content = py_file.read_text()
+                    content = read_text(py_file)
                     if "@api.depends" in content:
                         # Check for compute methods without proper dependencies
                         if "def _compute_" in content:
                             self.warnings.append(
-                                f"Verify compute method dependencies in {py_file.relative_to(self.module_path)}"
+                                f"Verify compute method dependencies in {self._rel(py_file)}"
                             )
                 except Exception as e:
                     self.warnings.append(f"Could not read {py_file}: {e}")
@@ -195,9 +149,13 @@ class Odoo18CompatibilityValidator:
         manifest_file = self.module_path / "__manifest__.py"
         if manifest_file.exists():
             try:
-                content = manifest_file.read_text()
-                if '"version"' in content:
-                    if not re.search(r'"version".*18\.0', content):
+                with open(manifest_file, "rb") as f:
+                    # "version" sits near the top of a manifest; read the rest only if the head is inconclusive
+                    content = f.read(MANIFEST_HEAD_SIZE)
+                    if not MANIFEST_VERSION_RE.search(content):
+                        content += f.read()
+                if b'"version"' in content:
+                    if not MANIFEST_VERSION_RE.search(content):
                         self.warnings.append("Manifest version should be 18.0.x.x.x for Odoo 18.0")
             except Exception as e:
                 self.warnings.append(f"Could not read manifest: {e}")
@@ -208,11 +166,11 @@ class Odoo18CompatibilityValidator:
         if data_dir.exists():
             for xml_file in data_dir.glob("*demo*.xml"):
                 try:
-                    content = xml_file.read_text()
+                    content = read_text(xml_file)
                     
                     # Check for potential date constraint issues
                     if "scheduled_date" in content and "datetime.now() -" in content:
-                        rel_path = xml_file.relative_to(self.module_path)
+                        rel_path = self._rel(xml_file)
                         self.warnings.append(
                             f"Demo data uses past dates for scheduled_date in {rel_path} - may violate business constraints"
                         )
@@ -220,14 +178,14 @@ class Odoo18CompatibilityValidator:
                     # Check for status and date combinations that might conflict
                     if "status" in content and "scheduled" in content:
                         if "datetime.now() -" in content:
-                            rel_path = xml_file.relative_to(self.module_path)
+                            rel_path = self._rel(xml_file)
                             self.warnings.append(
                                 f"Demo data has 'scheduled' status with past dates in {rel_path} - check business logic constraints"
                             )
                     
                     # Check for in_progress status with past dates
                     if 'status">in_progress' in content and "datetime.now() -" in content:
-                        rel_path = xml_file.relative_to(self.module_path)
+                        rel_path = self._rel(xml_file)
                         self.warnings.append(
                             f"Demo data has 'in_progress' status with past dates in {rel_path} - may violate date constraints"
                         )
@@ -241,7 +199,7 @@ class Odoo18CompatibilityValidator:
         if models_dir.exists():
             for py_file in models_dir.glob("*.py"):
                 try:
-                    content = py_file.read_text()
+                    content = read_text(py_file)
                     
                     # Check for .create() calls with hardcoded field names
                     if ".create(" in content and '"' in content:
@@ -250,7 +208,7 @@ class Odoo18CompatibilityValidator:
                         for i, line in enumerate(lines, 1):
                             if '.create(' in line or '"installation_notes"' in line:
                                 if '"installation_notes"' in line:
-                                    rel_path = py_file.relative_to(self.module_path)
+                                    rel_path = self._rel(py_file)
                                     self.warnings.append(
                                         f"Potential field mapping issue: 'installation_notes' may not exist on target model in {rel_path}:{i}"
                                     )
@@ -264,7 +222,7 @@ class Odoo18CompatibilityValidator:
         if models_dir.exists():
             for py_file in models_dir.glob("*.py"):
                 try:
-                    content = py_file.read_text()
+                    content = read_text(py_file)
                     if f"_inherit = '{model_name}'" in content or f'_inherit = "{model_name}"' in content:
                         return True
                 except Exception:
@@ -277,32 +235,32 @@ class Odoo18CompatibilityValidator:
         return "royal.installation" in model_name or "sale.order" in model_name
 
     def print_report(self):
-        """Print validation report"""
-        print("\n" + "=" * 60)
-        print("🔍 ODOO 18.0 COMPATIBILITY VALIDATION REPORT")
-        print("=" * 60)
+        """Print validation report in a single write"""
+        lines = ["\n" + "=" * 60, "🔍 ODOO 18.0 COMPATIBILITY VALIDATION REPORT", "=" * 60]
 
         if self.errors:
-            print(f"\n❌ ERRORS ({len(self.errors)}):")
-            for error in self.errors:
-                print(f"  • {error}")
+            lines.append(f"\n❌ ERRORS ({len(self.errors)}):")
+            lines.extend(f"  • {error}" for error in self.errors)
 
         if self.warnings:
-            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
-            for warning in self.warnings:
-                print(f"  • {warning}")
+            lines.append(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            lines.extend(f"  • {warning}" for warning in self.warnings)
 
         if not self.errors and not self.warnings:
-            print("\n✅ ALL CHECKS PASSED!")
-            print("Module appears to be fully compatible with Odoo 18.0")
+            lines.append("\n✅ ALL CHECKS PASSED!")
+            lines.append("Module appears to be fully compatible with Odoo 18.0")
         elif not self.errors:
-            print(f"\n✅ NO CRITICAL ERRORS FOUND!")
-            print(f"Only {len(self.warnings)} warnings to review")
+            lines.append(f"\n✅ NO CRITICAL ERRORS FOUND!")
+            lines.append(f"Only {len(self.warnings)} warnings to review")
         else:
-            print(f"\n🚨 {len(self.errors)} CRITICAL ERRORS FOUND!")
-            print("These must be fixed before deployment")
-
-        print("\n" + "=" * 60)
+            lines.append(f"\n🚨 {len(self.errors)} CRITICAL ERRORS FOUND!")
+            lines.append("These must be fixed before deployment")
+
+        lines.append("\n" + "=" * 60)
+        try:
+            sys.stdout.write("\n".join(lines) + "\n")
+        finally:
+            sys.stdout.flush()
         return len(self.errors) == 0
 
 
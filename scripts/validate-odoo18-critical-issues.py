@@ -6,7 +6,7 @@ Validates modules for the most critical Odoo 18 compatibility issues
 that cause deployment failures. Based on real-world testing.
 
 Usage:
-    python validate-odoo18-critical-issues.py [module_path]
+    python validate-odoo18-critical-issues.py [--strict] [module_path]
 """
 
 import argparse
@@ -15,16 +15,24 @@ import re
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import List
+
+from odoo18_xml_scanner import find_files, read_bytes, read_text
+
+
+def _rel(path, module_path):
+    """Path relative to the module, by slicing off the module path prefix"""
+    return path[len(str(module_path)) :].lstrip(os.sep)
 
 
 def check_tree_to_list_migration(module_path):
     """Check for tree->list migration issues"""
-    issues = []
+    issues: List[str] = []
     
-    for xml_file in Path(module_path).rglob("*.xml"):
+    for xml_file in find_files(module_path, ".xml"):
         try:
-            content = xml_file.read_text()
-            rel_path = xml_file.relative_to(Path(module_path))
+            content = read_text(xml_file)
+            rel_path = _rel(xml_file, module_path)
             
             # Check for <tree> tags
             if re.search(r'<tree[\s>]', content) or '</tree>' in content:
@@ -40,15 +48,20 @@ def check_tree_to_list_migration(module_path):
     return issues
 
 
-def check_xml_special_characters(module_path):
-    """Check for unescaped XML characters"""
-    issues = []
+def check_xml_special_characters(module_path, strict=False):
+    """Check for unescaped XML characters
+
+    Files with unescaped domains almost always fail to parse as well, so the
+    parse check only runs on them in strict mode.
+    """
+    issues: List[str] = []
     
-    for xml_file in Path(module_path).rglob("*.xml"):
+    for xml_file in find_files(module_path, ".xml"):
         try:
-            content = xml_file.read_text()
-            rel_path = xml_file.relative_to(Path(module_path))
-            lines = content.split('\n')
+            content = read_bytes(xml_file)
+            rel_path = _rel(xml_file, module_path)
+            lines = content.decode().split('\n')
+            issue_count = len(issues)
             
             for line_num, line in enumerate(lines, 1):
                 if 'domain=' in line:
@@ -60,11 +73,12 @@ def check_xml_special_characters(module_path):
                         if '>' in domain and '&gt;' not in domain:
                             issues.append(f"CRITICAL: {rel_path}:{line_num} unescaped '>' in domain")
             
-            # Try to parse XML
-            try:
-                ET.parse(xml_file)
-            except ET.ParseError as e:
-                issues.append(f"CRITICAL: {rel_path} XML parse error: {str(e)}")
+            if strict or len(issues) == issue_count:
+                # Try to parse XML, reusing the bytes already read
+                try:
+                    ET.fromstring(content)
+                except ET.ParseError as e:
+                    issues.append(f"CRITICAL: {rel_path} XML parse error: {str(e)}")
                 
         except Exception as e:
             print(f"Warning: Could not validate {xml_file}: {e}")
@@ -74,13 +88,13 @@ def check_xml_special_characters(module_path):
 
 def check_security_groups(module_path):
     """Check security group references"""
-    issues = []
+    issues: List[str] = []
     module_name = Path(module_path).name
     
-    for xml_file in Path(module_path).rglob("*.xml"):
+    for xml_file in find_files(module_path, ".xml"):
         try:
-            content = xml_file.read_text()
-            rel_path = xml_file.relative_to(Path(module_path))
+            content = read_text(xml_file)
+            rel_path = _rel(xml_file, module_path)
             
             group_matches = re.findall(r'groups="([^"]+)"', content)
             for group_ref in group_matches:
@@ -96,12 +110,12 @@ def check_security_groups(module_path):
 
 def check_manifest_version(module_path):
     """Check manifest version format"""
-    issues = []
+    issues: List[str] = []
     manifest_file = Path(module_path) / "__manifest__.py"
     
     if manifest_file.exists():
         try:
-            content = manifest_file.read_text()
+            content = read_text(manifest_file)
             if '"version"' in content:
                 if not re.search(r'"version".*"18\.0', content):
                     issues.append("CRITICAL: Manifest version must start with '18.0' for Odoo 18")
@@ -114,6 +128,9 @@ def check_manifest_version(module_path):
 def main():
     parser = argparse.ArgumentParser(description="Validate critical Odoo 18 compatibility issues")
     parser.add_argument("module_path", help="Path to the module to validate")
+    parser.add_argument(
+        "--strict", action="store_true", help="Also report XML parse errors for files with unescaped domains"
+    )
     args = parser.parse_args()
 
     if not os.path.exists(args.module_path):
@@ -122,9 +139,9 @@ def main():
 
     print(f"🔍 Checking critical Odoo 18 issues in {Path(args.module_path).name}...")
     
-    all_issues = []
+    all_issues: List[str] = []
     all_issues.extend(check_tree_to_list_migration(args.module_path))
-    all_issues.extend(check_xml_special_characters(args.module_path))
+    all_issues.extend(check_xml_special_characters(args.module_path, strict=args.strict))
     all_issues.extend(check_security_groups(args.module_path))
     all_issues.extend(check_manifest_version(args.module_path))
     
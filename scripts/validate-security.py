@@ -17,15 +17,66 @@ Key Features:
 - Security file organization validation
 
 Usage:
-    python scripts/validate-security.py [module_name]
+    python scripts/validate-security.py [--fail-fast] [--cache | --cache-file FILE] [module_name]
     python scripts/validate-security.py  # validates all modules
 """
 
+import argparse
 import csv
+import json
+import os
 import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    # Rejects entity declarations and external references instead of expanding/resolving them
+    from defusedxml.ElementTree import iterparse
+except ImportError:
+    iterparse = ET.iterparse
+
+# Read buffer for security files, so a whole file is normally fetched in one read
+READ_BUFFER_SIZE = 1 << 20
+
+# A collected finding: (file path, line number, message); rendered only when printed
+Diagnostic = Tuple[str, Optional[int], str]
+
+# Default file for per-file results of previous runs (--cache); files whose mtime and size are
+# unchanged are not re-validated
+CACHE_FILE = '.security_validation_cache.json'
+
+
+class OdooSecurityDialect(csv.Dialect):
+    """CSV dialect of Odoo's ir.model.access.csv files (what Odoo itself loads)."""
+
+    delimiter = ','
+    quotechar = '"'
+    doublequote = True
+    skipinitialspace = False
+    lineterminator = '\n'
+    quoting = csv.QUOTE_MINIMAL
+
+
+csv.register_dialect('odoo_security', OdooSecurityDialect)
+
+
+class FailFast(BaseException):
+    """Raised by SecurityValidator.error() in fail-fast mode to abandon validation.
+
+    Derives from BaseException so the per-file `except Exception` handlers don't swallow it.
+    """
+
+
+class CsvColumns(NamedTuple):
+    """Positions of the checked columns in an access CSV, resolved once from its header."""
+
+    required: List[Tuple[str, int]]
+    permissions: List[Tuple[str, int]]
+    id: Optional[int]
+    model: Optional[int]
+    group: Optional[int]
 
 
 class SecurityValidator:
@@ -46,9 +97,22 @@ class SecurityValidator:
     # Optional columns for ir.model.access.csv
     OPTIONAL_ACCESS_COLUMNS = {'active', 'comment'}
 
+    # Permission columns/fields of access rights and record rules
+    PERMISSION_FIELDS = frozenset({'perm_read', 'perm_write', 'perm_create', 'perm_unlink'})
+
+    # Separators allowed in CSV record IDs, stripped in one pass before the alphanumeric check
+    ID_SEPARATORS_TABLE = str.maketrans('', '', '_.')
+
     # Valid boolean values for permission columns
     VALID_PERMISSION_VALUES = {'1', '0', 'True', 'False', 'true', 'false'}
 
+    # Naming conventions checked for references and security file names
+    MODEL_REF_PREFIX = 'model_'
+    GROUP_REF_PREFIX = 'group_'
+    CATEGORY_REF_PREFIXES = ('module_category_',)
+    ACCESS_CSV_NAME = 'ir.model.access.csv'
+    SECURITY_XML_SUFFIX = '_security.xml'
+
     # Valid security models in XML
     SECURITY_MODELS = {
         'ir.model.access',
@@ -67,144 +131,228 @@ class SecurityValidator:
         'ir.module.category': {'name'},
     }
 
-    def __init__(self, base_path: str = "custom_modules"):
+    def __init__(
+        self,
+        base_path: str = "custom_modules",
+        cache: Optional[Dict[str, Dict[str, Any]]] = None,
+        fail_fast: bool = False,
+    ):
         self.base_path = Path(base_path)
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.info: List[str] = []
+        self.errors: List[Diagnostic] = []
+        self.warnings: List[Diagnostic] = []
+        self.info: List[Diagnostic] = []
         self.module_models: Dict[str, Set[str]] = {}
         self.module_groups: Dict[str, Set[str]] = {}
+        # File path -> stamp and recorded results, see validate_file_cached()
+        self.cache: Dict[str, Dict[str, Any]] = {} if cache is None else cache
+        # CSV header -> (column positions, missing required columns, unknown columns)
+        self.header_cache: Dict[Tuple[str, ...], Tuple[CsvColumns, Set[str], Set[str]]] = {}
+        # Stop at the first error; nothing (not even warnings) is collected after it
+        self.fail_fast = fail_fast
+        self.stopped = False
+
+    @staticmethod
+    def validator_stamp() -> List[int]:
+        """Stamp of this script, so cached results are dropped whenever the validator changes."""
+        stat = os.stat(__file__)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def load_cache(self, cache_file: str = CACHE_FILE):
+        """Load per-file results saved by a previous run of this same validator."""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('validator') == self.validator_stamp():
+            self.cache.update(data.get('files', {}))
+
+    def save_cache(self, cache_file: str = CACHE_FILE):
+        """Save per-file results for the next run; a cache that can't be written is skipped."""
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'validator': self.validator_stamp(), 'files': self.cache}, f)
+        except OSError:
+            pass
+
+    def validate_file_cached(self, file_path: Path, validate: Callable[[Path], bool]) -> bool:
+        """Run validate(file_path), or replay its recorded results if the file is unchanged."""
+        stat = file_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        key = str(file_path)
+        entry = self.cache.get(key)
+        # Under fail-fast a file with errors is validated again, so collection stops where a cold run stops
+        if entry is not None and entry['stamp'] == stamp and not (self.fail_fast and entry['errors']):
+            # JSON stores the diagnostics as lists
+            self.errors.extend(map(tuple, entry['errors']))
+            self.warnings.extend(map(tuple, entry['warnings']))
+            self.info.extend(map(tuple, entry['info']))
+            return bool(entry['success'])
+
+        errors_start, warnings_start, info_start = len(self.errors), len(self.warnings), len(self.info)
+        success = validate(file_path)
+        self.cache[key] = {
+            'stamp': stamp,
+            'success': success,
+            'errors': self.errors[errors_start:],
+            'warnings': self.warnings[warnings_start:],
+            'info': self.info[info_start:],
+        }
+        return success
 
     def error(self, message: str, file_path: str = "", line_num: Optional[int] = None):
         """Add an error message."""
-        location = f"{file_path}"
-        if line_num:
-            location += f":{line_num}"
-        self.errors.append(f"❌ {location}: {message}")
+        self.errors.append((file_path, line_num, message))
+        if self.fail_fast:
+            self.stopped = True
+            raise FailFast()
 
     def warning(self, message: str, file_path: str = "", line_num: Optional[int] = None):
         """Add a warning message."""
-        location = f"{file_path}"
-        if line_num:
-            location += f":{line_num}"
-        self.warnings.append(f"⚠️  {location}: {message}")
+        self.warnings.append((file_path, line_num, message))
 
     def add_info(self, message: str, file_path: str = "", line_num: Optional[int] = None):
         """Add an info message."""
-        location = f"{file_path}"
-        if line_num:
-            location += f":{line_num}"
-        self.info.append(f"ℹ️  {location}: {message}")
+        self.info.append((file_path, line_num, message))
+
+    @staticmethod
+    def format_diagnostic(prefix: str, diagnostic: Diagnostic) -> str:
+        """Render a collected diagnostic as '<prefix> <file>[:<line>]: <message>'."""
+        file_path, line_num, message = diagnostic
+        location = f"{file_path}:{line_num}" if line_num else file_path
+        return f"{prefix} {location}: {message}"
 
     def validate_csv_structure(self, file_path: Path) -> bool:
         """Validate CSV file structure and format."""
         success = True
+        path_str = str(file_path)
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Check if file is empty
-                content = f.read().strip()
-                if not content:
-                    self.warning("Empty CSV file", str(file_path))
+            with open(file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+                # Check if file is empty (or only whitespace) without reading all of it
+                first = f.read(1)
+                while first.isspace():
+                    first = f.read(1)
+                if not first:
+                    self.warning("Empty CSV file", path_str)
                     return False
 
                 # Reset file pointer for CSV reader
                 f.seek(0)
 
-                # Detect CSV dialect
-                sample = f.read(1024)
-                f.seek(0)
-
-                try:
-                    dialect = csv.Sniffer().sniff(sample)
-                except csv.Error:
-                    # Use default dialect if detection fails
-                    dialect = csv.excel
-
-                # Read CSV with detected dialect
-                reader = csv.DictReader(f, dialect=dialect)
+                # Odoo only loads comma-separated access files, so there is no dialect to detect.
+                # Rows are plain lists indexed by column position.
+                reader = csv.reader(f, dialect='odoo_security')
+                header = next(reader, None)
 
                 # Validate column structure
-                if not reader.fieldnames:
-                    self.error("CSV file has no headers", str(file_path))
+                if not header:
+                    self.error("CSV file has no headers", path_str)
                     return False
 
-                fieldnames = set(reader.fieldnames)
+                columns, missing_required, unknown_columns = self.analyze_csv_header(header)
 
                 # Check for required columns
-                missing_required = self.REQUIRED_ACCESS_COLUMNS - fieldnames
                 if missing_required:
-                    self.error(f"Missing required columns: {', '.join(missing_required)}", str(file_path))
+                    self.error(f"Missing required columns: {', '.join(missing_required)}", path_str)
                     success = False
 
                 # Check for unknown columns
-                valid_columns = self.REQUIRED_ACCESS_COLUMNS | self.OPTIONAL_ACCESS_COLUMNS
-                unknown_columns = fieldnames - valid_columns
                 if unknown_columns:
-                    self.warning(f"Unknown columns: {', '.join(unknown_columns)}", str(file_path))
+                    self.warning(f"Unknown columns: {', '.join(unknown_columns)}", path_str)
 
                 # Validate row content
                 row_num = 1
+                validate_row = self.validate_csv_row
                 for row in reader:
+                    if not row:
+                        continue
                     row_num += 1
-                    success &= self.validate_csv_row(row, file_path, row_num)
+                    success &= validate_row(row, columns, path_str, row_num)
 
                 # Check if file has any data rows
                 if row_num == 1:
-                    self.warning("CSV file has headers but no data", str(file_path))
+                    self.warning("CSV file has headers but no data", path_str)
 
         except UnicodeDecodeError:
-            self.error("File encoding not supported. Use UTF-8.", str(file_path))
+            self.error("File encoding not supported. Use UTF-8.", path_str)
             success = False
         except Exception as e:
-            self.error(f"Error reading CSV file: {e}", str(file_path))
+            self.error(f"Error reading CSV file: {e}", path_str)
             success = False
 
         return success
 
-    def validate_csv_row(self, row: Dict[str, str], file_path: Path, row_num: int) -> bool:
-        """Validate a single CSV row."""
+    def analyze_csv_header(self, header: List[str]) -> Tuple[CsvColumns, Set[str], Set[str]]:
+        """Return the column positions, missing required columns and unknown columns of an access CSV header."""
+        # Access CSVs across modules nearly always share a header, so its analysis is cached
+        header_key = tuple(header)
+        header_info = self.header_cache.get(header_key)
+        if header_info is None:
+            fieldnames = set(header)
+            valid_columns = self.REQUIRED_ACCESS_COLUMNS | self.OPTIONAL_ACCESS_COLUMNS
+            header_info = (
+                self.resolve_csv_columns(header),
+                self.REQUIRED_ACCESS_COLUMNS - fieldnames,
+                fieldnames - valid_columns,
+            )
+            self.header_cache[header_key] = header_info
+        return header_info
+
+    def resolve_csv_columns(self, header: List[str]) -> CsvColumns:
+        """Map the checked access CSV columns to their positions in header."""
+        index = {name: i for i, name in enumerate(header)}
+        return CsvColumns(
+            required=[(name, index[name]) for name in self.REQUIRED_ACCESS_COLUMNS if name in index],
+            permissions=[(name, index[name]) for name in self.PERMISSION_FIELDS if name in index],
+            id=index.get('id'),
+            model=index.get('model_id:id'),
+            group=index.get('group_id:id'),
+        )
+
+    def validate_csv_row(self, row: List[str], columns: CsvColumns, file_path: str, row_num: int) -> bool:
+        """Validate a single CSV row, given the column positions resolved from the header."""
         success = True
+        row = [value.strip() for value in row]
 
         # Check for empty required fields
-        for field in self.REQUIRED_ACCESS_COLUMNS:
-            if field in row and not row[field].strip():
-                self.error(f"Empty required field '{field}'", str(file_path), row_num)
+        for field, i in columns.required:
+            if not row[i]:
+                self.error(f"Empty required field '{field}'", file_path, row_num)
                 success = False
 
         # Validate permission values
-        permission_fields = {'perm_read', 'perm_write', 'perm_create', 'perm_unlink'}
-        for field in permission_fields:
-            if field in row and row[field].strip():
-                value = row[field].strip()
-                if value not in self.VALID_PERMISSION_VALUES:
-                    self.error(
-                        f"Invalid permission value '{value}' for {field}. Use: {', '.join(self.VALID_PERMISSION_VALUES)}",
-                        str(file_path),
-                        row_num,
-                    )
-                    success = False
+        valid_perms = self.VALID_PERMISSION_VALUES
+        for field, i in columns.permissions:
+            value = row[i]
+            if value and value not in valid_perms:
+                self.error(
+                    f"Invalid permission value '{value}' for {field}. Use: {', '.join(valid_perms)}",
+                    file_path,
+                    row_num,
+                )
+                success = False
 
         # Validate ID format
-        if 'id' in row and row['id'].strip():
-            id_value = row['id'].strip()
-            if not id_value.replace('_', '').replace('.', '').isalnum():
-                self.warning(f"ID '{id_value}' contains unusual characters", str(file_path), row_num)
+        if columns.id is not None and row[columns.id]:
+            id_value = row[columns.id]
+            if not id_value.translate(self.ID_SEPARATORS_TABLE).isalnum():
+                self.warning(f"ID '{id_value}' contains unusual characters", file_path, row_num)
 
         # Validate model reference format
-        if 'model_id:id' in row and row['model_id:id'].strip():
-            model_ref = row['model_id:id'].strip()
-            if not model_ref.startswith('model_'):
-                self.warning(f"Model reference '{model_ref}' should start with 'model_'", str(file_path), row_num)
+        if columns.model is not None and row[columns.model]:
+            model_ref = row[columns.model]
+            if not model_ref.startswith(self.MODEL_REF_PREFIX):
+                self.warning(f"Model reference '{model_ref}' should start with 'model_'", file_path, row_num)
 
         # Validate group reference format
-        if 'group_id:id' in row and row['group_id:id'].strip():
-            group_ref = row['group_id:id'].strip()
+        if columns.group is not None and row[columns.group]:
+            group_ref = row[columns.group]
             # Group references can be external (module.group_name) or internal
-            if '.' not in group_ref and not group_ref.startswith('group_'):
+            if '.' not in group_ref and not group_ref.startswith(self.GROUP_REF_PREFIX):
                 self.add_info(
                     f"Group reference '{group_ref}' - consider using 'group_' prefix or module.group format",
-                    str(file_path),
+                    file_path,
                     row_num,
                 )
 
@@ -213,63 +361,78 @@ class SecurityValidator:
     def validate_xml_security(self, file_path: Path) -> bool:
         """Validate XML security files."""
         success = True
+        path_str = str(file_path)
+        root = None
+        menuitems = []
+        security_models = self.SECURITY_MODELS
 
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                # Single streaming pass: each record is validated once complete and then cleared
+                for event, elem in iterparse(f, events=('start', 'end')):
+                    if root is None:
+                        root = elem
+
+                        # Check root element
+                        if root.tag not in ['odoo', 'openerp']:
+                            self.error(f"Invalid root element '{root.tag}'. Expected 'odoo' or 'openerp'", path_str)
+                            success = False
+                    elif event == 'start':
+                        # Menu items only need their attributes; collected in document order
+                        if elem.tag == 'menuitem':
+                            menuitems.append(elem)
+                    elif elem.tag == 'record':
+                        # Validate security records
+                        if elem.get('model') in security_models:
+                            success &= self.validate_security_record(elem, path_str)
+                        elem.clear()
         except ET.ParseError as e:
-            self.error(f"XML parsing error: {e}", str(file_path))
+            self.error(f"XML parsing error: {e}", path_str)
             return False
         except Exception as e:
-            self.error(f"Error reading XML file: {e}", str(file_path))
+            self.error(f"Error reading XML file: {e}", path_str)
             return False
 
-        # Check root element
-        if root.tag not in ['odoo', 'openerp']:
-            self.error(f"Invalid root element '{root.tag}'. Expected 'odoo' or 'openerp'", str(file_path))
-            success = False
-
-        # Validate security records
-        for record in root.iter('record'):
-            model = record.attrib.get('model')
-            if model in self.SECURITY_MODELS:
-                success &= self.validate_security_record(record, file_path)
-
         # Validate menu items (they can have security implications)
-        for menuitem in root.iter('menuitem'):
-            success &= self.validate_menuitem_security(menuitem, file_path)
+        for menuitem in menuitems:
+            success &= self.validate_menuitem_security(menuitem, path_str)
 
         return success
 
-    def validate_security_record(self, record: ET.Element, file_path: Path) -> bool:
+    def validate_security_record(self, record: ET.Element, file_path: str) -> bool:
         """Validate a security record in XML."""
         success = True
 
-        model = record.attrib.get('model')
-        record_id = record.attrib.get('id', 'unknown')
+        attrs = record.attrib
+        model = attrs.get('model')
+        record_id = attrs.get('id', 'unknown')
 
         # Check required attributes
-        if not record.attrib.get('id'):
-            self.error("Security record missing 'id' attribute", str(file_path))
+        if not record_id or 'id' not in attrs:
+            self.error("Security record missing 'id' attribute", file_path)
             success = False
 
         if not model:
-            self.error("Security record missing 'model' attribute", str(file_path))
+            self.error("Security record missing 'model' attribute", file_path)
             success = False
             return success
 
         # Get field values
-        field_values = {}
-        for field in record.findall('field'):
-            field_name = field.attrib.get('name')
+        field_values: Dict[str, str] = {}
+        for field in record:
+            if field.tag != 'field':
+                continue
+            field_name = field.get('name')
             if field_name:
-                field_values[field_name] = field.text or field.attrib.get('ref', '')
+                field_values[field_name] = field.text or field.get('ref') or ''
 
         # Check required fields for specific models
-        if model in self.REQUIRED_FIELDS:
-            missing_fields = self.REQUIRED_FIELDS[model] - set(field_values.keys())
+        required_fields = self.REQUIRED_FIELDS.get(model)
+        if required_fields:
+            # Checked against the dict directly instead of building a set of its keys
+            missing_fields = [name for name in required_fields if name not in field_values]
             if missing_fields:
-                self.error(f"Record '{record_id}' missing required fields: {', '.join(missing_fields)}", str(file_path))
+                self.error(f"Record '{record_id}' missing required fields: {', '.join(missing_fields)}", file_path)
                 success = False
 
         # Model-specific validation
@@ -282,83 +445,91 @@ class SecurityValidator:
 
         return success
 
-    def validate_access_record(self, record: ET.Element, fields: Dict[str, str], file_path: Path) -> bool:
+    def validate_access_record(self, record: ET.Element, fields: Dict[str, str], file_path: str) -> bool:
         """Validate ir.model.access record."""
         success = True
 
         # Validate permission fields
-        permission_fields = {'perm_read', 'perm_write', 'perm_create', 'perm_unlink'}
-        for perm_field in permission_fields:
+        valid_perms = self.VALID_PERMISSION_VALUES
+        for perm_field in self.PERMISSION_FIELDS:
             if perm_field in fields:
                 value = fields[perm_field].strip()
-                if value and value not in self.VALID_PERMISSION_VALUES:
-                    self.error(f"Invalid permission value '{value}' for {perm_field}", str(file_path))
+                if value and value not in valid_perms:
+                    self.error(f"Invalid permission value '{value}' for {perm_field}", file_path)
                     success = False
 
         # Check model reference
         if 'model_id' in fields:
             model_ref = fields['model_id']
-            if model_ref and not model_ref.startswith('model_'):
-                self.warning(f"Model reference '{model_ref}' should reference a model record", str(file_path))
+            if model_ref and not model_ref.startswith(self.MODEL_REF_PREFIX):
+                self.warning(f"Model reference '{model_ref}' should reference a model record", file_path)
 
         return success
 
-    def validate_rule_record(self, record: ET.Element, fields: Dict[str, str], file_path: Path) -> bool:
+    def validate_rule_record(self, record: ET.Element, fields: Dict[str, str], file_path: str) -> bool:
         """Validate ir.rule record."""
         success = True
 
         # Check for domain_force field
         if 'domain_force' not in fields:
-            self.warning("Security rule without 'domain_force' field", str(file_path))
+            self.warning("Security rule without 'domain_force' field", file_path)
         elif fields.get('domain_force'):
             domain = fields['domain_force']
             # Basic domain syntax validation
             if not (domain.startswith('[') and domain.endswith(']')):
-                self.warning(f"Domain '{domain}' should be a list format", str(file_path))
+                self.warning(f"Domain '{domain}' should be a list format", file_path)
 
         # Check rule type fields
-        rule_types = {'perm_read', 'perm_write', 'perm_create', 'perm_unlink'}
-        has_rule_type = any(field in fields for field in rule_types)
+        has_rule_type = any(field in fields for field in self.PERMISSION_FIELDS)
         if not has_rule_type:
-            self.add_info("Security rule without specific permission types (applies to all)", str(file_path))
+            self.add_info("Security rule without specific permission types (applies to all)", file_path)
 
         return success
 
-    def validate_group_record(self, record: ET.Element, fields: Dict[str, str], file_path: Path) -> bool:
+    def validate_group_record(self, record: ET.Element, fields: Dict[str, str], file_path: str) -> bool:
         """Validate res.groups record."""
         success = True
 
         # Check category reference
         if 'category_id' in fields:
             category_ref = fields['category_id']
-            if category_ref and not (category_ref.startswith('module_category_') or '.' in category_ref):
-                self.add_info(
-                    f"Category reference '{category_ref}' - ensure it references a valid category", str(file_path)
-                )
+            if category_ref and not (category_ref.startswith(self.CATEGORY_REF_PREFIXES) or '.' in category_ref):
+                self.add_info(f"Category reference '{category_ref}' - ensure it references a valid category", file_path)
 
         # Check for implied_ids field (group inheritance)
         if 'implied_ids' in fields:
-            self.add_info("Group uses inheritance (implied_ids)", str(file_path))
+            self.add_info("Group uses inheritance (implied_ids)", file_path)
 
         return success
 
-    def validate_menuitem_security(self, menuitem: ET.Element, file_path: Path) -> bool:
+    def validate_menuitem_security(self, menuitem: ET.Element, file_path: str) -> bool:
         """Validate menuitem security attributes."""
         success = True
 
         # Check for groups attribute
-        if 'groups' in menuitem.attrib:
-            groups = menuitem.attrib['groups']
+        groups = menuitem.get('groups')
+        if groups is not None:
             # Groups should be comma-separated external IDs
             if groups and not all(g.strip() for g in groups.split(',')):
-                self.warning("Empty group reference in menuitem", str(file_path))
+                self.warning("Empty group reference in menuitem", file_path)
         else:
-            self.add_info("Menu item without explicit groups (visible to all users)", str(file_path))
+            self.add_info("Menu item without explicit groups (visible to all users)", file_path)
 
         return success
 
-    def validate_security_file_organization(self, module_path: Path, module_name: str) -> bool:
-        """Validate security file organization and naming."""
+    @staticmethod
+    def list_files(directory: Path) -> List[Path]:
+        """List the regular files in directory (file types come from the listing, not a stat per entry)."""
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_file()]
+
+    def validate_security_file_organization(
+        self, module_path: Path, module_name: str, security_files: Optional[List[Path]] = None
+    ) -> bool:
+        """Validate security file organization and naming.
+
+        security_files is the listing of the module's security directory, when the caller already has it.
+        """
         success = True
 
         security_dir = module_path / 'security'
@@ -367,24 +538,25 @@ class SecurityValidator:
             self.add_info(f"No security directory found in module: {module_name}")
             return True
 
+        if security_files is None:
+            security_files = self.list_files(security_dir)
+        security_dir_str = str(security_dir)
+
         # Check for common security files
-        access_csv = security_dir / 'ir.model.access.csv'
-        if not access_csv.exists():
-            self.add_info("No ir.model.access.csv file found", str(security_dir))
+        if not any(path.name == self.ACCESS_CSV_NAME for path in security_files):
+            self.add_info("No ir.model.access.csv file found", security_dir_str)
 
         # Check for XML security files
-        xml_files = list(security_dir.glob('*.xml'))
-        if not xml_files:
-            self.add_info("No XML security files found", str(security_dir))
+        if not any(path.name.endswith('.xml') and not path.name.startswith('.') for path in security_files):
+            self.add_info("No XML security files found", security_dir_str)
 
         # Validate file naming conventions
-        for file_path in security_dir.iterdir():
-            if file_path.is_file():
-                filename = file_path.name
-                if filename.endswith('.csv') and filename != 'ir.model.access.csv':
-                    self.warning(f"Unusual CSV filename: {filename}", str(file_path))
-                elif filename.endswith('.xml') and not filename.endswith('_security.xml'):
-                    self.add_info(f"Consider using '_security.xml' suffix: {filename}", str(file_path))
+        for file_path in security_files:
+            filename = file_path.name
+            if filename.endswith('.csv') and filename != self.ACCESS_CSV_NAME:
+                self.warning(f"Unusual CSV filename: {filename}", str(file_path))
+            elif filename.endswith('.xml') and not filename.endswith(self.SECURITY_XML_SUFFIX):
+                self.add_info(f"Consider using '_security.xml' suffix: {filename}", str(file_path))
 
         return success
 
@@ -398,46 +570,82 @@ class SecurityValidator:
 
         success = True
 
+        # List the security directory once for the organization, CSV and XML checks
+        security_dir = module_path / 'security'
+        security_files = self.list_files(security_dir) if security_dir.is_dir() else []
+
         # Validate file organization
-        success &= self.validate_security_file_organization(module_path, module_name)
+        success &= self.validate_security_file_organization(module_path, module_name, security_files)
 
-        security_dir = module_path / 'security'
         if not security_dir.exists():
             return success
 
+        # Hidden files are skipped, as a '*.csv' / '*.xml' glob would
+        visible_files = [path for path in security_files if not path.name.startswith('.')]
+
         # Validate CSV files
-        csv_files = list(security_dir.glob('*.csv'))
+        csv_files = [path for path in visible_files if path.name.endswith('.csv')]
         for csv_file in csv_files:
-            if not self.validate_csv_structure(csv_file):
+            if not self.validate_file_cached(csv_file, self.validate_csv_structure):
                 success = False
 
         # Validate XML files
-        xml_files = list(security_dir.glob('*.xml'))
+        xml_files = [path for path in visible_files if path.name.endswith('.xml')]
         for xml_file in xml_files:
-            if not self.validate_xml_security(xml_file):
+            if not self.validate_file_cached(xml_file, self.validate_xml_security):
                 success = False
 
         return success
 
     def validate_all_modules(self) -> bool:
         """Validate security files in all modules."""
+        try:
+            return self._validate_all_modules()
+        except FailFast:
+            return False
+
+    def _validate_all_modules(self) -> bool:
+        """Body of validate_all_modules; may raise FailFast."""
         if not self.base_path.exists():
             self.error(f"Custom modules directory not found: {self.base_path}")
             return False
 
-        modules = [d for d in self.base_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
+        # DirEntry.is_dir() answers from the directory listing itself, without a stat per entry
+        with os.scandir(self.base_path) as entries:
+            modules = [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith('.')]
 
         if not modules:
             self.warning("No modules found in custom_modules directory")
             return True
 
+        # Modules are independent, so they are validated concurrently and merged back in order
         success = True
-        for module_dir in modules:
-            if not self.validate_module_security(module_dir.name):
-                success = False
+        executor = ThreadPoolExecutor()
+        try:
+            for module_success, validator in executor.map(self._validate_module_isolated, modules):
+                success &= module_success
+                self.errors.extend(validator.errors)
+                self.warnings.extend(validator.warnings)
+                self.info.extend(validator.info)
+                if validator.stopped:
+                    # Fail-fast: report this module up to its first error and drop the rest
+                    self.stopped = True
+                    raise FailFast()
+        finally:
+            executor.shutdown(cancel_futures=True)
 
         return success
 
+    def _validate_module_isolated(self, module_name: str) -> Tuple[bool, 'SecurityValidator']:
+        """Validate one module with a private validator, returning (success, validator)."""
+        validator = self.__class__(str(self.base_path), cache=self.cache, fail_fast=self.fail_fast)
+        validator.header_cache = self.header_cache
+        try:
+            success = validator.validate_module_security(module_name)
+        except FailFast:
+            success = False
+        return success, validator
+
     def print_results(self):
         """Print validation results in a clear, structured format."""
         print("\n" + "=" * 70)
@@ -449,17 +657,17 @@ class SecurityValidator:
         if self.errors:
             print(f"\n❌ CRITICAL ERRORS ({len(self.errors)}):")
             for error in self.errors:
-                print(f"  {error}")
+                print(f"  {self.format_diagnostic('❌', error)}")
 
         if self.warnings:
             print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
             for warning in self.warnings:
-                print(f"  {warning}")
+                print(f"  {self.format_diagnostic('⚠️ ', warning)}")
 
         if self.info:
             print(f"\nℹ️  SUGGESTIONS ({len(self.info)}):")
             for info in self.info:
-                print(f"  {info}")
+                print(f"  {self.format_diagnostic('ℹ️ ', info)}")
 
         print("\n" + "=" * 70)
         if not self.errors and not self.warnings:
@@ -477,18 +685,38 @@ class SecurityValidator:
 
 def main():
     """Main function."""
-    validator = SecurityValidator()
+    parser = argparse.ArgumentParser(description="Validate Odoo module security files")
+    parser.add_argument("module_name", nargs="?", help="Module to validate (default: all modules)")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop at the first error; later warnings are not collected"
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--cache", action="store_true", help=f"Reuse results of unchanged files, kept in {CACHE_FILE}"
+    )
+    cache_group.add_argument("--cache-file", metavar="FILE", help="Reuse results of unchanged files, kept in FILE")
+    args = parser.parse_args()
+    cache_file = args.cache_file or (CACHE_FILE if args.cache else None)
+
+    validator = SecurityValidator(fail_fast=args.fail_fast)
+    if cache_file:
+        validator.load_cache(cache_file)
 
     print("🔍 Starting Odoo Security File Validation...")
 
-    if len(sys.argv) > 1:
-        module_name = sys.argv[1]
+    if args.module_name:
+        module_name = args.module_name
         print(f"📦 Validating security files in module: {module_name}")
-        success = validator.validate_module_security(module_name)
+        try:
+            success = validator.validate_module_security(module_name)
+        except FailFast:
+            success = False
     else:
         print("📦 Validating security files in all modules...")
         success = validator.validate_all_modules()
 
+    if cache_file:
+        validator.save_cache(cache_file)
     validator.print_results()
 
     # Exit with error code if validation failed
@@ -18,244 +18,316 @@ Key Features:
 - Data file structure validation
 
 Usage:
-    python scripts/validate-xml.py [module_name]
+    python scripts/validate-xml.py [module_name] [--jobs N]
     python scripts/validate-xml.py  # validates all modules
 """
 
+import argparse
+import io
+import mmap
+import os
 import re
 import sys
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    # libxml2-backed: faster parsing, and elements know their source line
+    from lxml import etree as ET
+
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    LXML_AVAILABLE = False
+
+# Odoo model names: dot-separated lowercase alphanumeric parts
+MODEL_NAME_RE = re.compile(r'^[a-z][a-z0-9]*(\.[a-z][a-z0-9]*)*$')
+
+# Without lxml, XML files of at least this size are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+
+class FileKind(NamedTuple):
+    """What an XML file holds, judged from its path once per file."""
+
+    is_view: bool
+    is_security: bool
 
 
 class XMLValidator:
     """Comprehensive validator for Odoo XML files."""
 
     # Valid Odoo view types
-    VALID_VIEW_TYPES = {
-        'form',
-        'tree',
-        'kanban',
-        'calendar',
-        'pivot',
-        'graph',
-        'gantt',
-        'dashboard',
-        'search',
-        'activity',
-        'qweb',
-        'map',
-        'cohort',
-    }
+    VALID_VIEW_TYPES = frozenset(
+        {
+            'form',
+            'tree',
+            'kanban',
+            'calendar',
+            'pivot',
+            'graph',
+            'gantt',
+            'dashboard',
+            'search',
+            'activity',
+            'qweb',
+            'map',
+            'cohort',
+        }
+    )
 
     # Valid field widget types (common ones)
-    VALID_WIDGETS = {
-        'char',
-        'text',
-        'html',
-        'email',
-        'url',
-        'phone',
-        'image',
-        'binary',
-        'selection',
-        'radio',
-        'many2one',
-        'many2many',
-        'one2many',
-        'date',
-        'datetime',
-        'float',
-        'monetary',
-        'integer',
-        'boolean',
-        'progressbar',
-        'handle',
-        'priority',
-        'toggle_button',
-        'badge',
-        'statusbar',
-        'percentage',
-        'float_time',
-        'color',
-        'signature',
-    }
+    VALID_WIDGETS = frozenset(
+        {
+            'char',
+            'text',
+            'html',
+            'email',
+            'url',
+            'phone',
+            'image',
+            'binary',
+            'selection',
+            'radio',
+            'many2one',
+            'many2many',
+            'one2many',
+            'date',
+            'datetime',
+            'float',
+            'monetary',
+            'integer',
+            'boolean',
+            'progressbar',
+            'handle',
+            'priority',
+            'toggle_button',
+            'badge',
+            'statusbar',
+            'percentage',
+            'float_time',
+            'color',
+            'signature',
+        }
+    )
 
     # Valid record models for security and data
-    SECURITY_MODELS = {'ir.model.access', 'ir.rule', 'res.groups', 'ir.module.category'}
+    SECURITY_MODELS = frozenset({'ir.model.access', 'ir.rule', 'res.groups', 'ir.module.category'})
 
     # Valid action types
-    ACTION_MODELS = {
-        'ir.actions.act_window',
-        'ir.actions.act_url',
-        'ir.actions.server',
-        'ir.actions.report',
-        'ir.actions.client',
-        'ir.ui.menu',
+    ACTION_MODELS = frozenset(
+        {
+            'ir.actions.act_window',
+            'ir.actions.act_url',
+            'ir.actions.server',
+            'ir.actions.report',
+            'ir.actions.client',
+            'ir.ui.menu',
+        }
+    )
+
+    # Expected root elements of a view's arch, by view type
+    VALID_VIEW_ROOTS = {
+        'form': frozenset({'form'}),
+        'tree': frozenset({'tree', 'list'}),
+        'kanban': frozenset({'kanban'}),
+        'search': frozenset({'search'}),
+        'calendar': frozenset({'calendar'}),
+        'pivot': frozenset({'pivot'}),
+        'graph': frozenset({'graph'}),
+        'gantt': frozenset({'gantt'}),
     }
 
-    def __init__(self, base_path: str = "custom_modules"):
+    # Elements expected directly under the root, and those that belong inside one of them
+    VALID_ROOT_CHILDREN = frozenset({'data'})
+    WRAPPED_ROOT_CHILDREN = frozenset({'record', 'menuitem', 'template'})
+
+    # Fields an ir.model.access record and a window action are expected to set
+    ACCESS_REQUIRED_FIELDS = frozenset({'name', 'model_id', 'perm_read', 'perm_write', 'perm_create', 'perm_unlink'})
+    ACT_WINDOW_REQUIRED_FIELDS = frozenset({'name', 'res_model', 'view_mode'})
+
+    # Field attributes that are deprecated outside view files
+    DEPRECATED_FIELD_ATTRS = frozenset({'colspan', 'position'})
+
+    # Elements whose 'id' declares an XML id other files of the module can reference
+    ID_DECLARING_TAGS = frozenset({'record', 'menuitem', 'template', 'report', 'act_window'})
+
+    # XML ids Odoo generates for models and fields, so no file of the module declares them
+    GENERATED_ID_PREFIXES = ('model_', 'field_')
+
+    def __init__(self, base_path: str = "custom_modules", jobs: int = 1):
         self.base_path = Path(base_path)
+        # Worker processes used to validate a module's files; 1 validates them in this process
+        self.jobs = jobs
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
-
-    def error(self, message: str, file_path: str = "", line_num: Optional[int] = None):
-        """Add an error message."""
-        location = f"{file_path}"
-        if line_num:
-            location += f":{line_num}"
+        # XML ids declared by the module being validated, and the refs to check against them
+        # once all its files are read: (ref, field name, file, line)
+        self.declared_ids: Set[str] = set()
+        self.pending_refs: List[Tuple[str, str, str, Optional[int]]] = []
+
+    def error(
+        self, message: str, file_path: str = "", line_num: Optional[int] = None, element: Optional[ET.Element] = None
+    ):
+        """Add an error message, located at element's source line if given."""
+        location = self.format_location(file_path, line_num, element)
         self.errors.append(f"❌ {location}: {message}")
 
-    def warning(self, message: str, file_path: str = "", line_num: Optional[int] = None):
-        """Add a warning message."""
-        location = f"{file_path}"
-        if line_num:
-            location += f":{line_num}"
+    def warning(
+        self, message: str, file_path: str = "", line_num: Optional[int] = None, element: Optional[ET.Element] = None
+    ):
+        """Add a warning message, located at element's source line if given."""
+        location = self.format_location(file_path, line_num, element)
         self.warnings.append(f"⚠️  {location}: {message}")
 
-    def add_info(self, message: str, file_path: str = "", line_num: Optional[int] = None):
-        """Add an info message."""
-        location = f"{file_path}"
-        if line_num:
-            location += f":{line_num}"
+    def add_info(
+        self, message: str, file_path: str = "", line_num: Optional[int] = None, element: Optional[ET.Element] = None
+    ):
+        """Add an info message, located at element's source line if given."""
+        location = self.format_location(file_path, line_num, element)
         self.info.append(f"ℹ️  {location}: {message}")
 
-    def get_line_number(self, element: ET.Element, xml_content: str) -> Optional[int]:
-        """Get line number for an XML element (best effort)."""
-        try:
-            # This is a simplified approach - XML parsing doesn't preserve line numbers easily
-            # We'll search for the element's tag in the content
-            if hasattr(element, 'tag') and element.tag:
-                # Look for the opening tag
-                pattern = f"<{element.tag}"
-                lines = xml_content.split('\n')
-                for i, line in enumerate(lines, 1):
-                    if pattern in line:
-                        return i
-            return None
-        except (AttributeError, ValueError):
-            return None
-
-    def validate_xml_syntax(self, file_path: Path) -> Tuple[bool, Optional[ET.Element]]:
-        """Validate XML syntax and return parsed tree."""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            return True, root
-        except ET.ParseError as e:
-            self.error(f"XML syntax error: {e}", str(file_path))
-            return False, None
-        except UnicodeDecodeError:
-            self.error("File encoding not supported. Use UTF-8.", str(file_path))
-            return False, None
-        except Exception as e:
-            self.error(f"XML parsing error: {e}", str(file_path))
-            return False, None
+    def format_location(self, file_path: str, line_num: Optional[int], element: Optional[ET.Element]) -> str:
+        """Format 'file[:line]', taking the line from element when one is given."""
+        if line_num is None and element is not None:
+            line_num = self.get_line_number(element, file_path)
+        if line_num:
+            return f"{file_path}:{line_num}"
+        return f"{file_path}"
+
+    def get_line_number(self, element: ET.Element, file_path: str) -> Optional[int]:
+        """Get line number for an XML element: lxml's sourceline, or None under the stdlib parser."""
+        return getattr(element, 'sourceline', None)
 
-    def validate_odoo_root_structure(self, root: ET.Element, file_path: Path) -> bool:
-        """Validate that XML has proper Odoo root structure."""
+    def validate_odoo_root_tag(self, root: ET.Element, file_path: str) -> bool:
+        """Validate the tag of the XML root element."""
         success = True
 
         # Check root element
         if root.tag != 'odoo':
             # Legacy format check
             if root.tag == 'openerp':
-                self.warning("Using legacy '<openerp>' root element. Consider updating to '<odoo>'", str(file_path))
+                self.warning(
+                    "Using legacy '<openerp>' root element. Consider updating to '<odoo>'",
+                    file_path,
+                    element=root,
+                )
             else:
-                self.error(f"Root element should be '<odoo>', found '<{root.tag}>'", str(file_path))
+                self.error(f"Root element should be '<odoo>', found '<{root.tag}>'", file_path, element=root)
                 success = False
 
-        # Check for direct child elements - should typically be 'data' elements
-        valid_root_children = {'data'}
-        for child in root:
-            if child.tag not in valid_root_children:
-                if child.tag in {'record', 'menuitem', 'template'}:
-                    self.warning(
-                        f"Found '{child.tag}' directly under root. Consider wrapping in '<data>' element",
-                        str(file_path),
-                    )
-                else:
-                    self.warning(f"Unexpected root child element: '{child.tag}'", str(file_path))
+        return success
+
+    def validate_root_child(self, child: ET.Element, file_path: str):
+        """Validate a direct child of the root element; these should typically be 'data' elements."""
+        if child.tag not in self.VALID_ROOT_CHILDREN:
+            if child.tag in self.WRAPPED_ROOT_CHILDREN:
+                self.warning(
+                    f"Found '{child.tag}' directly under root. Consider wrapping in '<data>' element",
+                    file_path,
+                    element=child,
+                )
+            else:
+                self.warning(f"Unexpected root child element: '{child.tag}'", file_path, element=child)
+
+    def validate_record(self, record: ET.Element, file_path: str, file_kind: FileKind) -> bool:
+        """Run every check that applies to a <record>, dispatching on its model."""
+        # Collect the record's fields once; every check below works from these
+        fields = record.findall('field')
+        success = self.validate_record_structure(record, file_path, fields, file_kind)
+
+        model = record.get('model')
+        handler = self.RECORD_HANDLERS.get(model)
+        if handler is None or (model in self.SECURITY_MODELS and not file_kind.is_security):
+            # Plain data records have no model-specific checks, so skip building the field lookup
+            return success
+
+        fields_by_name = {field.get('name'): field for field in fields}
+        success &= handler(self, record, file_path, fields_by_name)
 
         return success
 
-    def validate_record_structure(self, record: ET.Element, file_path: Path) -> bool:
+    def validate_record_structure(
+        self, record: ET.Element, file_path: str, fields: List[ET.Element], file_kind: FileKind
+    ) -> bool:
         """Validate structure of <record> elements."""
         success = True
 
         # Check required attributes
         if 'id' not in record.attrib:
-            self.error("Record missing required 'id' attribute", str(file_path))
+            self.error("Record missing required 'id' attribute", file_path, element=record)
             success = False
 
         if 'model' not in record.attrib:
-            self.error("Record missing required 'model' attribute", str(file_path))
+            self.error("Record missing required 'model' attribute", file_path, element=record)
             success = False
         else:
             model = record.attrib['model']
             # Validate model name format
-            if not re.match(r'^[a-z][a-z0-9]*(\.[a-z][a-z0-9]*)*$', model):
-                self.warning(f"Model name '{model}' doesn't follow naming convention", str(file_path))
+            if not MODEL_NAME_RE.match(model):
+                self.warning(f"Model name '{model}' doesn't follow naming convention", file_path, element=record)
 
         # Validate field elements
-        for field in record.findall('field'):
-            self.validate_field_element(field, file_path)
+        for field in fields:
+            self.validate_field_element(field, file_path, file_kind)
 
         return success
 
-    def validate_field_element(self, field: ET.Element, file_path: Path) -> bool:
+    def validate_field_element(self, field: ET.Element, file_path: str, file_kind: FileKind) -> bool:
         """Validate <field> elements within records."""
         success = True
 
         # Check required 'name' attribute
         if 'name' not in field.attrib:
-            self.error("Field element missing required 'name' attribute", str(file_path))
+            self.error("Field element missing required 'name' attribute", file_path, element=field)
             success = False
 
         field_name = field.attrib.get('name', '')
 
         # Check for common field validation issues
         if 'eval' in field.attrib and 'ref' in field.attrib:
-            self.warning(f"Field '{field_name}' has both 'eval' and 'ref' attributes", str(file_path))
+            self.warning(f"Field '{field_name}' has both 'eval' and 'ref' attributes", file_path, element=field)
 
         # Validate reference fields
         if 'ref' in field.attrib:
             ref_value = field.attrib['ref']
             if not ref_value:
-                self.error(f"Field '{field_name}' has empty 'ref' attribute", str(file_path))
+                self.error(f"Field '{field_name}' has empty 'ref' attribute", file_path, element=field)
                 success = False
+            else:
+                line_num = self.get_line_number(field, file_path)
+                self.pending_refs.append((ref_value, field_name, file_path, line_num))
 
         # Check for deprecated attributes
-        deprecated_attrs = {'colspan', 'position'}
-        for attr in deprecated_attrs:
-            if attr in field.attrib and 'view' not in str(file_path).lower():
-                self.warning(f"Field '{field_name}' uses potentially deprecated attribute '{attr}'", str(file_path))
+        if not file_kind.is_view:
+            for attr in self.DEPRECATED_FIELD_ATTRS:
+                if attr in field.attrib:
+                    self.warning(
+                        f"Field '{field_name}' uses potentially deprecated attribute '{attr}'",
+                        file_path,
+                        element=field,
+                    )
 
         return success
 
-    def validate_view_structure(self, record: ET.Element, file_path: Path) -> bool:
+    def validate_view_structure(
+        self, record: ET.Element, file_path: str, fields_by_name: Dict[Optional[str], ET.Element]
+    ) -> bool:
         """Validate view-specific record structure."""
         success = True
 
-        if record.attrib.get('model') != 'ir.ui.view':
-            return success
-
         # Find view type and architecture
-        view_type = None
-        arch_field = None
-
-        for field in record.findall('field'):
-            field_name = field.attrib.get('name')
-            if field_name == 'type':
-                view_type = field.text
-            elif field_name == 'arch':
-                arch_field = field
+        type_field = fields_by_name.get('type')
+        view_type = type_field.text if type_field is not None else None
+        arch_field = fields_by_name.get('arch')
 
         # Validate view type
         if view_type and view_type not in self.VALID_VIEW_TYPES:
-            self.warning(f"Unknown view type: '{view_type}'", str(file_path))
+            self.warning(f"Unknown view type: '{view_type}'", file_path, element=record)
 
         # Validate view architecture
         if arch_field is not None:
@@ -263,157 +335,201 @@ class XMLValidator:
 
         return success
 
-    def validate_view_architecture(self, arch_field: ET.Element, view_type: Optional[str], file_path: Path) -> bool:
+    def validate_view_architecture(self, arch_field: ET.Element, view_type: Optional[str], file_path: str) -> bool:
         """Validate view architecture structure."""
         success = True
 
         # Check for proper view root elements
-        valid_view_roots = {
-            'form': {'form'},
-            'tree': {'tree', 'list'},
-            'kanban': {'kanban'},
-            'search': {'search'},
-            'calendar': {'calendar'},
-            'pivot': {'pivot'},
-            'graph': {'graph'},
-            'gantt': {'gantt'},
-        }
-
-        if view_type and view_type in valid_view_roots:
+        if view_type and view_type in self.VALID_VIEW_ROOTS:
             found_valid_root = False
             for child in arch_field:
-                if child.tag in valid_view_roots[view_type]:
+                if child.tag in self.VALID_VIEW_ROOTS[view_type]:
                     found_valid_root = True
                     break
 
             if not found_valid_root:
-                expected_roots = ', '.join(valid_view_roots[view_type])
-                self.warning(f"View type '{view_type}' should have root element: {expected_roots}", str(file_path))
+                expected_roots = ', '.join(self.VALID_VIEW_ROOTS[view_type])
+                self.warning(
+                    f"View type '{view_type}' should have root element: {expected_roots}",
+                    file_path,
+                    element=arch_field,
+                )
 
         # Validate field widgets in views
         for field_elem in arch_field.iter('field'):
-            if 'widget' in field_elem.attrib:
-                widget = field_elem.attrib['widget']
-                if widget not in self.VALID_WIDGETS:
-                    self.add_info(f"Unknown widget type: '{widget}'", str(file_path))
+            widget = field_elem.get('widget')
+            if widget is not None and widget not in self.VALID_WIDGETS:
+                self.add_info(f"Unknown widget type: '{widget}'", file_path, element=field_elem)
 
         return success
 
-    def validate_security_file(self, root: ET.Element, file_path: Path) -> bool:
-        """Validate security-specific XML structure."""
-        success = True
-
-        for record in root.iter('record'):
-            model = record.attrib.get('model')
-
-            if model in self.SECURITY_MODELS:
-                success &= self.validate_security_record(record, model, file_path)
-
-        return success
-
-    def validate_security_record(self, record: ET.Element, model: str, file_path: Path) -> bool:
-        """Validate specific security record types."""
-        success = True
-
-        if model == 'ir.model.access':
-            # Check required fields for access rights
-            required_fields = {'name', 'model_id', 'perm_read', 'perm_write', 'perm_create', 'perm_unlink'}
-            declared_fields = {field.attrib.get('name') for field in record.findall('field')}
-
-            missing_fields = required_fields - declared_fields
-            if missing_fields:
-                self.warning(
-                    f"Access rights record missing recommended fields: {', '.join(missing_fields)}", str(file_path)
-                )
-
-        elif model == 'ir.rule':
-            # Check rule structure
-            name_field = record.find("field[@name='name']")
-            if name_field is None:
-                self.error("Security rule missing 'name' field", str(file_path))
-                success = False
+    def validate_access_record(
+        self, record: ET.Element, file_path: str, fields_by_name: Dict[Optional[str], ET.Element]
+    ) -> bool:
+        """Validate an access rights (ir.model.access) record."""
+        missing_fields = self.ACCESS_REQUIRED_FIELDS.difference(fields_by_name)
+        if missing_fields:
+            self.warning(
+                f"Access rights record missing recommended fields: {', '.join(missing_fields)}",
+                file_path,
+                element=record,
+            )
+
+        return True
+
+    def validate_rule_record(
+        self, record: ET.Element, file_path: str, fields_by_name: Dict[Optional[str], ET.Element]
+    ) -> bool:
+        """Validate a record rule (ir.rule) record."""
+        if 'name' not in fields_by_name:
+            self.error("Security rule missing 'name' field", file_path, element=record)
+            return False
 
-        return success
+        return True
 
-    def validate_menu_and_actions(self, root: ET.Element, file_path: Path) -> bool:
-        """Validate menu items and actions."""
+    def validate_menuitem(self, menuitem: ET.Element, file_path: str) -> bool:
+        """Validate the required attributes of a <menuitem> element."""
         success = True
 
-        # Validate menuitem elements
-        for menuitem in root.iter('menuitem'):
-            if 'id' not in menuitem.attrib:
-                self.error("Menu item missing 'id' attribute", str(file_path))
-                success = False
-
-            if 'name' not in menuitem.attrib:
-                self.error("Menu item missing 'name' attribute", str(file_path))
-                success = False
+        if 'id' not in menuitem.attrib:
+            self.error("Menu item missing 'id' attribute", file_path, element=menuitem)
+            success = False
 
-        # Validate action records
-        for record in root.iter('record'):
-            model = record.attrib.get('model')
-            if model in self.ACTION_MODELS:
-                success &= self.validate_action_record(record, model, file_path)
+        if 'name' not in menuitem.attrib:
+            self.error("Menu item missing 'name' attribute", file_path, element=menuitem)
+            success = False
 
         return success
 
-    def validate_action_record(self, record: ET.Element, model: str, file_path: Path) -> bool:
-        """Validate action record structure."""
-        success = True
-
-        if model == 'ir.actions.act_window':
-            # Check for required fields
-            required_fields = {'name', 'res_model', 'view_mode'}
-            declared_fields = {field.attrib.get('name') for field in record.findall('field')}
-
-            missing_fields = required_fields - declared_fields
-            if missing_fields:
-                self.warning(f"Window action missing recommended fields: {', '.join(missing_fields)}", str(file_path))
-
-        elif model == 'ir.ui.menu':
-            # Validate menu structure
-            action_field = record.find("field[@name='action']")
-            if action_field is not None and 'ref' in action_field.attrib:
-                # This is good - menu references an action
-                pass
-            else:
-                parent_field = record.find("field[@name='parent_id']")
-                if parent_field is None:
-                    self.add_info("Menu item without action or parent - may be a root menu", str(file_path))
+    def validate_act_window_record(
+        self, record: ET.Element, file_path: str, fields_by_name: Dict[Optional[str], ET.Element]
+    ) -> bool:
+        """Validate a window action (ir.actions.act_window) record."""
+        missing_fields = self.ACT_WINDOW_REQUIRED_FIELDS.difference(fields_by_name)
+        if missing_fields:
+            self.warning(
+                f"Window action missing recommended fields: {', '.join(missing_fields)}",
+                file_path,
+                element=record,
+            )
+
+        return True
+
+    def validate_menu_record(
+        self, record: ET.Element, file_path: str, fields_by_name: Dict[Optional[str], ET.Element]
+    ) -> bool:
+        """Validate a menu (ir.ui.menu) record."""
+        action_field = fields_by_name.get('action')
+        if action_field is not None and 'ref' in action_field.attrib:
+            # This is good - menu references an action
+            return True
 
-        return success
+        if 'parent_id' not in fields_by_name:
+            self.add_info(
+                "Menu item without action or parent - may be a root menu",
+                file_path,
+                element=record,
+            )
+
+        return True
+
+    # Model-specific record checks, looked up once per record by validate_record;
+    # security models are only checked in security files
+    RECORD_HANDLERS = {
+        'ir.ui.view': validate_view_structure,
+        'ir.model.access': validate_access_record,
+        'ir.rule': validate_rule_record,
+        'ir.actions.act_window': validate_act_window_record,
+        'ir.ui.menu': validate_menu_record,
+    }
 
     def validate_xml_file(self, file_path: Path, module_name: str) -> bool:
         """Validate a single XML file."""
-        rel_path = file_path.relative_to(self.base_path / module_name)
+        # Every diagnostic of the file carries this string: build it once, interned so repeats share it
+        rel_path = sys.intern(str(file_path.relative_to(self.base_path / module_name)))
 
-        # Step 1: Validate XML syntax
-        syntax_valid, root = self.validate_xml_syntax(file_path)
-        if not syntax_valid or root is None:
-            return False
+        # Findings made before a syntax error turns up are dropped; the syntax error is the one to report
+        marks = (len(self.errors), len(self.warnings), len(self.info), len(self.pending_refs))
+        try:
+            if LXML_AVAILABLE:
+                return self.validate_xml_stream(file_path, rel_path)
+
+            # The stdlib parser reads through Python: large files are mapped rather than copied in
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                    return self.validate_xml_stream(io.BytesIO(f.read()), rel_path)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return self.validate_xml_stream(content, rel_path)
+        except ET.ParseError as e:
+            message = f"XML syntax error: {e}"
+        except UnicodeDecodeError:
+            message = "File encoding not supported. Use UTF-8."
+        except Exception as e:
+            message = f"XML parsing error: {e}"
 
-        success = True
+        for messages, mark in zip((self.errors, self.warnings, self.info), marks):
+            del messages[mark:]
+        del self.pending_refs[marks[3] :]
+        self.error(message, str(file_path))
+        return False
 
-        # Step 2: Validate Odoo root structure
-        success &= self.validate_odoo_root_structure(root, rel_path)
+    def validate_xml_stream(self, source, rel_path: str) -> bool:
+        """Validate a file's elements in a single pass while it is parsed.
 
-        # Step 3: Validate record structures
-        for record in root.iter('record'):
-            success &= self.validate_record_structure(record, rel_path)
+        source is a path, or a file-like object (such as an mmap) when the caller has opened the file.
+        Each record is checked once complete and then cleared, so memory stays bounded by one record.
+        Raises ET.ParseError if the file is not well-formed.
+        """
+        success = True
+        file_kind = FileKind(is_view='view' in rel_path.lower(), is_security='security' in rel_path)
 
-        # Step 4: Validate view-specific structures
-        for record in root.iter('record'):
-            if record.attrib.get('model') == 'ir.ui.view':
-                success &= self.validate_view_structure(record, rel_path)
+        if LXML_AVAILABLE:
+            events = ET.iterparse(
+                str(source), events=('start', 'end'), remove_comments=True, remove_pis=True, huge_tree=False
+            )
+        else:
+            events = ET.iterparse(source, events=('start', 'end'))
+
+        depth = 0
+        for event, elem in events:
+            if event == 'start':
+                if depth == 0:
+                    # Children may not be parsed yet at the start event, so only the tag is checked here
+                    success &= self.validate_odoo_root_tag(elem, rel_path)
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                self.validate_root_child(elem, rel_path)
+
+            tag = elem.tag
+            if tag in self.ID_DECLARING_TAGS:
+                self.collect_declared_id(elem)
+
+            if tag == 'record':
+                success &= self.validate_record(elem, rel_path, file_kind)
+                # Only top-level records: ones nested in a view arch are still part of it
+                if depth <= 2:
+                    self.release_record(elem)
+            elif tag == 'menuitem':
+                success &= self.validate_menuitem(elem, rel_path)
 
-        # Step 5: Validate security files
-        if 'security' in str(rel_path):
-            success &= self.validate_security_file(root, rel_path)
+        return success
 
-        # Step 6: Validate menus and actions
-        success &= self.validate_menu_and_actions(root, rel_path)
+    def collect_declared_id(self, elem: ET.Element):
+        """Record the XML id an element declares, for validate_references."""
+        xml_id = elem.get('id')
+        if xml_id:
+            self.declared_ids.add(xml_id)
 
-        return success
+    @staticmethod
+    def release_record(record: ET.Element):
+        """Free a checked record and the siblings processed before it."""
+        record.clear()
+        if LXML_AVAILABLE:
+            while record.getprevious() is not None:
+                del record.getparent()[0]
 
     def validate_module_xml(self, module_name: str) -> bool:
         """Validate all XML files in a module."""
@@ -424,19 +540,75 @@ class XMLValidator:
             return False
 
         # Find all XML files
-        xml_files = list(module_path.rglob("*.xml"))
+        xml_files = self.list_xml_files(module_path)
 
         if not xml_files:
             self.add_info(f"No XML files found in module: {module_name}")
             return True
 
         success = True
-        for xml_file in xml_files:
-            if not self.validate_xml_file(xml_file, module_name):
-                success = False
-
+        if self.jobs <= 1 or len(xml_files) == 1:
+            for xml_file in xml_files:
+                if not self.validate_xml_file(xml_file, module_name):
+                    success = False
+        else:
+            # Files are independent and parsing is CPU-bound, so they are spread over processes;
+            # map() yields results in file order, keeping the report order unchanged
+            validate_one = partial(validate_xml_file_isolated, str(self.base_path), module_name)
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                for file_success, validator in executor.map(validate_one, xml_files, chunksize=8):
+                    success &= file_success
+                    self.errors.extend(validator.errors)
+                    self.warnings.extend(validator.warnings)
+                    self.info.extend(validator.info)
+                    self.declared_ids |= validator.declared_ids
+                    self.pending_refs.extend(validator.pending_refs)
+
+        self.validate_references(module_name)
         return success
 
+    @staticmethod
+    def list_xml_files(directory: Path) -> List[Path]:
+        """List the XML files under directory, in rglob's order, with one scandir per directory.
+
+        Entry types come from the listing rather than a stat per path; symlinked directories are not followed.
+        """
+        xml_files = []
+        stack = [str(directory)]
+        while stack:
+            subdirs = []
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith('.xml'):
+                        xml_files.append(Path(entry.path))
+            # Files of a directory come before its subdirectories, which are visited in listing order
+            stack.extend(reversed(subdirs))
+        return xml_files
+
+    def validate_references(self, module_name: str):
+        """Check the module's collected field refs against the XML ids its files declare."""
+        own_prefix = f"{module_name}."
+        declared_ids = {
+            xml_id[len(own_prefix) :] if xml_id.startswith(own_prefix) else xml_id for xml_id in self.declared_ids
+        }
+
+        for ref_value, field_name, file_path, line_num in self.pending_refs:
+            module, _, xml_id = ref_value.rpartition('.')
+            # Ids of other modules and generated ids can't be resolved from this module's files
+            if (module and module != module_name) or xml_id.startswith(self.GENERATED_ID_PREFIXES):
+                continue
+            if xml_id not in declared_ids:
+                self.warning(
+                    f"Field '{field_name}' references '{ref_value}', which no XML file of the module declares",
+                    file_path,
+                    line_num,
+                )
+
+        self.declared_ids.clear()
+        self.pending_refs.clear()
+
     def validate_all_modules(self) -> bool:
         """Validate XML files in all modules."""
         if not self.base_path.exists():
@@ -457,50 +629,69 @@ class XMLValidator:
         return success
 
     def print_results(self):
-        """Print validation results in a clear, structured format."""
-        print("\n" + "=" * 70)
-        print("🔍 ODOO XML VALIDATION RESULTS")
-        print("=" * 70)
+        """Print validation results in a clear, structured format, in a single write."""
+        lines = ["\n" + "=" * 70, "🔍 ODOO XML VALIDATION RESULTS", "=" * 70]
 
         total_issues = len(self.errors) + len(self.warnings)
 
         if self.errors:
-            print(f"\n❌ CRITICAL ERRORS ({len(self.errors)}):")
-            for error in self.errors:
-                print(f"  {error}")
+            lines.append(f"\n❌ CRITICAL ERRORS ({len(self.errors)}):")
+            lines.extend(f"  {error}" for error in self.errors)
 
         if self.warnings:
-            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            lines.append(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            lines.extend(f"  {warning}" for warning in self.warnings)
 
         if self.info:
-            print(f"\nℹ️  SUGGESTIONS ({len(self.info)}):")
-            for info in self.info:
-                print(f"  {info}")
+            lines.append(f"\nℹ️  SUGGESTIONS ({len(self.info)}):")
+            lines.extend(f"  {info}" for info in self.info)
 
-        print("\n" + "=" * 70)
+        lines.append("\n" + "=" * 70)
         if not self.errors and not self.warnings:
-            print("✅ ALL XML VALIDATIONS PASSED!")
+            lines.append("✅ ALL XML VALIDATIONS PASSED!")
         elif not self.errors:
-            print(f"✅ No errors found ({len(self.warnings)} warnings)")
+            lines.append(f"✅ No errors found ({len(self.warnings)} warnings)")
         else:
-            print(f"❌ Validation failed: {len(self.errors)} errors, {len(self.warnings)} warnings")
+            lines.append(f"❌ Validation failed: {len(self.errors)} errors, {len(self.warnings)} warnings")
 
         if total_issues == 0:
-            print("🎉 Your XML files are ready for deployment!")
+            lines.append("🎉 Your XML files are ready for deployment!")
+
+        lines.append("=" * 70)
+        try:
+            sys.stdout.write("\n".join(lines) + "\n")
+        finally:
+            sys.stdout.flush()
+
+
+def validate_xml_file_isolated(base_path: str, module_name: str, file_path: Path) -> Tuple[bool, XMLValidator]:
+    """Validate one file with a private validator, returning (success, validator).
 
-        print("=" * 70)
+    Runs in a worker process; the validator is pickled back with its findings.
+    """
+    validator = XMLValidator(base_path)
+    success = validator.validate_xml_file(file_path, module_name)
+    return success, validator
 
 
 def main():
     """Main function."""
-    validator = XMLValidator()
+    parser = argparse.ArgumentParser(description="Validate Odoo module XML files")
+    parser.add_argument("module_name", nargs="?", help="Module to validate (default: all modules)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes validating files in parallel (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    validator = XMLValidator(jobs=args.jobs)
 
     print("🔍 Starting Odoo XML Validation...")
 
-    if len(sys.argv) > 1:
-        module_name = sys.argv[1]
+    if args.module_name:
+        module_name = args.module_name
         print(f"📦 Validating XML files in module: {module_name}")
         success = validator.validate_module_xml(module_name)
     else:
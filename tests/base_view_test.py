@@ -7,8 +7,8 @@ including XML validation, field presence checking, and UI interaction testing.
 """
 
 import logging
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 from unittest.mock import Mock, patch
 
 import pytest
@@ -38,6 +38,44 @@ except ImportError:
         pass
 
 
+# Strings are parsed as their UTF-8 encoding; the parser is told so, so an encoding declaration in the
+# document can't make lxml decode those bytes as another charset
+UTF8_PARSER = etree.XMLParser(encoding='utf-8')
+
+# Lookups the assertion helpers make, compiled once. Names are passed as XPath variables rather than
+# formatted into the expression, so quotes in a name can't break it
+STATUSBAR_FIELD = etree.XPath(".//field[@name=$name][@widget='statusbar']")
+# Filters whose context groups by a field; quotes and spaces are dropped so {'group_by': 'x'} matches too, and
+# the value must end at ',' or '}' so a field whose name merely starts with $name doesn't match
+GROUP_BY_FILTER = etree.XPath(
+    """.//filter[
+        contains(translate(translate(@context, "'", ''), '" ', ''), concat('group_by:', $name, ','))
+        or contains(translate(translate(@context, "'", ''), '" ', ''), concat('group_by:', $name, '}'))
+    ]"""
+)
+
+
+def find_descendant(root: etree._Element, tag: str, attribute: str, value: str) -> Optional[etree._Element]:
+    """Return the first descendant of root with the given tag and attribute value, or None.
+
+    Stops at the first match, where an XPath query collects every match before returning.
+    """
+    for element in root.iterdescendants(tag):
+        if element.get(attribute) == value:
+            return element
+    return None
+
+
+@lru_cache(maxsize=256)
+def parse_arch(arch_xml: str) -> etree._Element:
+    """Parse a view architecture, once per distinct arch string.
+
+    The assertion helpers each parse the arch they are given, and a test usually makes several assertions
+    on one arch. The returned tree is shared between calls, so it must not be modified.
+    """
+    return etree.fromstring(arch_xml.encode(), UTF8_PARSER)
+
+
 class BaseViewTest:
     """
     Base test class for Odoo view testing without database dependency.
@@ -73,43 +111,51 @@ class BaseViewTest:
         </record>
         """
 
-    def parse_view_xml(self, xml_string: str) -> ET.Element:
+    def parse_view_xml(self, xml_string: str) -> etree._Element:
         """Parse XML string and return root element."""
+        # Parsed as UTF-8 bytes: lxml rejects str input that carries an encoding declaration
         try:
-            return ET.fromstring(xml_string)
-        except ET.ParseError as e:
+            return etree.fromstring(xml_string.encode(), UTF8_PARSER)
+        except etree.XMLSyntaxError as e:
             pytest.fail(f"Invalid XML structure: {e}")
 
-    def parse_view_arch(self, arch_xml: str) -> ET.Element:
-        """Parse view architecture XML."""
+    def parse_view_arch(self, arch_xml: str) -> etree._Element:
+        """Parse view architecture XML (cached and shared: don't modify the returned tree)."""
         try:
-            return ET.fromstring(arch_xml)
-        except ET.ParseError as e:
+            return parse_arch(arch_xml)
+        except etree.XMLSyntaxError as e:
             pytest.fail(f"Invalid view architecture XML: {e}")
 
     def assert_xml_valid(self, xml_string: str):
         """Assert that XML string is valid."""
         try:
-            ET.fromstring(xml_string)
-        except ET.ParseError as e:
+            etree.fromstring(xml_string.encode(), UTF8_PARSER)
+        except etree.XMLSyntaxError as e:
             pytest.fail(f"XML validation failed: {e}")
 
     def assert_view_field_present(self, arch_xml: str, field_name: str):
         """Assert that a field is present in the view architecture."""
         root = self.parse_view_arch(arch_xml)
-        fields = root.findall(".//field[@name='{}']".format(field_name))
-        assert len(fields) > 0, f"Field {field_name} not found in view"
+        field = find_descendant(root, 'field', 'name', field_name)
+        assert field is not None, f"Field {field_name} not found in view"
+
+    def assert_view_fields_present(self, arch_xml: str, field_names: Iterable[str]):
+        """Assert that several fields are present in the view architecture, in a single pass over it."""
+        root = self.parse_view_arch(arch_xml)
+        present = {field.get('name') for field in root.iterdescendants('field')}
+        missing = [field_name for field_name in field_names if field_name not in present]
+        assert not missing, f"Fields {', '.join(missing)} not found in view"
 
     def assert_view_field_absent(self, arch_xml: str, field_name: str):
         """Assert that a field is NOT present in the view architecture."""
         root = self.parse_view_arch(arch_xml)
-        fields = root.findall(".//field[@name='{}']".format(field_name))
-        assert len(fields) == 0, f"Field {field_name} should not be in view"
+        field = find_descendant(root, 'field', 'name', field_name)
+        assert field is None, f"Field {field_name} should not be in view"
 
     def assert_view_field_attribute(self, arch_xml: str, field_name: str, attribute: str, expected_value: str):
         """Assert that a field has a specific attribute value."""
         root = self.parse_view_arch(arch_xml)
-        field = root.find(".//field[@name='{}']".format(field_name))
+        field = find_descendant(root, 'field', 'name', field_name)
         assert field is not None, f"Field {field_name} not found in view"
 
         actual_value = field.get(attribute)
@@ -120,29 +166,27 @@ class BaseViewTest:
     def assert_view_button_present(self, arch_xml: str, button_name: str):
         """Assert that a button is present in the view."""
         root = self.parse_view_arch(arch_xml)
-        buttons = root.findall(".//button[@name='{}']".format(button_name))
-        assert len(buttons) > 0, f"Button {button_name} not found in view"
+        button = find_descendant(root, 'button', 'name', button_name)
+        assert button is not None, f"Button {button_name} not found in view"
 
     def assert_view_group_present(self, arch_xml: str, group_string: str = None):
         """Assert that a group element is present in the view."""
         root = self.parse_view_arch(arch_xml)
         if group_string:
-            groups = root.findall(".//group[@string='{}']".format(group_string))
+            group = find_descendant(root, 'group', 'string', group_string)
         else:
-            groups = root.findall(".//group")
-        assert len(groups) > 0, f"Group {group_string or ''} not found in view"
+            group = root.find(".//group")
+        assert group is not None, f"Group {group_string or ''} not found in view"
 
     def get_view_fields(self, arch_xml: str) -> List[str]:
         """Get list of all field names in the view."""
         root = self.parse_view_arch(arch_xml)
-        fields = root.findall(".//field")
-        return [field.get('name') for field in fields if field.get('name')]
+        return [name for name in (field.get('name') for field in root.iterdescendants('field')) if name]
 
     def get_view_buttons(self, arch_xml: str) -> List[str]:
         """Get list of all button names in the view."""
         root = self.parse_view_arch(arch_xml)
-        buttons = root.findall(".//button")
-        return [button.get('name') for button in buttons if button.get('name')]
+        return [name for name in (button.get('name') for button in root.iterdescendants('button')) if name]
 
 
 class BaseOdooViewTest(TransactionCase if ODOO_AVAILABLE else BaseViewTest):
@@ -284,19 +328,17 @@ class BaseFormViewTest(BaseOdooViewTest):
     def assert_form_has_sheet(self, arch_xml: str):
         """Assert that a form view has a sheet element."""
         root = self.parse_view_arch(arch_xml)
-        sheets = root.findall(".//sheet")
-        assert len(sheets) > 0, "Form view should have a sheet element"
+        assert root.find(".//sheet") is not None, "Form view should have a sheet element"
 
     def assert_form_has_header(self, arch_xml: str):
         """Assert that a form view has a header element."""
         root = self.parse_view_arch(arch_xml)
-        headers = root.findall(".//header")
-        assert len(headers) > 0, "Form view should have a header element"
+        assert root.find(".//header") is not None, "Form view should have a header element"
 
     def assert_form_has_statusbar(self, arch_xml: str, field_name: str):
         """Assert that a form view has a statusbar widget."""
         root = self.parse_view_arch(arch_xml)
-        statusbars = root.findall(f".//field[@name='{field_name}'][@widget='statusbar']")
+        statusbars = STATUSBAR_FIELD(root, name=field_name)
         assert len(statusbars) > 0, f"Form view should have statusbar for field {field_name}"
 
 
@@ -346,13 +388,13 @@ class BaseSearchViewTest(BaseOdooViewTest):
     def assert_search_filter_present(self, arch_xml: str, filter_name: str):
         """Assert that a search filter is present."""
         root = self.parse_view_arch(arch_xml)
-        filters = root.findall(f".//filter[@name='{filter_name}']")
-        assert len(filters) > 0, f"Search filter {filter_name} not found"
+        search_filter = find_descendant(root, 'filter', 'name', filter_name)
+        assert search_filter is not None, f"Search filter {filter_name} not found"
 
     def assert_search_group_by_present(self, arch_xml: str, field_name: str):
         """Assert that a group by option is present."""
         root = self.parse_view_arch(arch_xml)
-        group_bys = root.findall(f".//filter[@context*='group_by:{field_name}']")
+        group_bys = GROUP_BY_FILTER(root, name=field_name)
         assert len(group_bys) > 0, f"Group by {field_name} not found in search view"
 
 
@@ -410,9 +452,7 @@ class ExampleFormViewTest(BaseFormViewTest):
         arch = view_data.get('arch', '')
 
         # Test that essential fields are present
-        self.assert_view_field_present(arch, 'name')
-        self.assert_view_field_present(arch, 'email')
-        self.assert_view_field_present(arch, 'phone')
+        self.assert_view_fields_present(arch, ['name', 'email', 'phone'])
 
         # Test that form has proper structure
         self.assert_form_has_sheet(arch)
@@ -444,8 +484,7 @@ class ExampleListViewTest(BaseListViewTest):
         arch = view_data.get('arch', '')
 
         # Test that essential fields are present
-        self.assert_view_field_present(arch, 'name')
-        self.assert_view_field_present(arch, 'email')
+        self.assert_view_fields_present(arch, ['name', 'email'])
 
         # Test that operations are allowed
         self.assert_list_has_create_button(arch)
@@ -0,0 +1,66 @@
+"""Unit tests for the field assertion helpers of tests/base_model_test.py."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tests.base_model_test import BaseModelTest
+
+
+class CharField(SimpleNamespace):
+    """Stand-in for an Odoo field: only the attributes the helpers read."""
+
+
+class PartnerModel:
+    """Stand-in for an Odoo model class, with its field registry."""
+
+    _fields = {
+        'name': CharField(required=True, readonly=False, string='Name', help='Display name'),
+        'ref': CharField(required=False, readonly=True, string='Reference', help=''),
+    }
+
+
+class TestAssertFieldSpec:
+    """assert_field_spec checks only the properties it is given."""
+
+    @pytest.mark.unit
+    def test_matching_spec_passes(self):
+        """A field matching every given property passes."""
+        BaseModelTest.assert_field_spec(
+            PartnerModel,
+            'name',
+            required=True,
+            expected_type=CharField,
+            readonly=False,
+            expected_string='Name',
+            expected_help='Display name',
+        )
+        BaseModelTest.assert_field_spec(PartnerModel, 'ref', required=False, readonly=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        'field_name, spec, message',
+        [
+            ('ref', {'required': True}, "Field ref should be required"),
+            ('name', {'required': False}, "Field name should not be required"),
+            ('name', {'expected_type': int}, "Field name should be of type int"),
+            ('name', {'readonly': True}, "Field name readonly should be True"),
+            ('name', {'expected_string': 'Label'}, "Field name string should be 'Label'"),
+            ('name', {'expected_help': 'Other'}, "Field name help should be 'Other'"),
+        ],
+    )
+    def test_mismatch_fails_with_message(self, field_name, spec, message):
+        """A property that doesn't match fails with a message naming it."""
+        with pytest.raises(AssertionError, match=message):
+            BaseModelTest.assert_field_spec(PartnerModel, field_name, **spec)
+
+    @pytest.mark.unit
+    def test_missing_field_fails(self):
+        """A field the model doesn't have fails the lookup."""
+        with pytest.raises(AssertionError, match="Field email not found on model"):
+            BaseModelTest.assert_field_spec(PartnerModel, 'email', required=True)
+
+    @pytest.mark.unit
+    def test_non_model_class_is_skipped(self):
+        """A class without a field registry is not an Odoo model, so nothing is checked."""
+        BaseModelTest.assert_field_spec(object, 'name', required=True)
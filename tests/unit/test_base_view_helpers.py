@@ -0,0 +1,65 @@
+"""Unit tests for the view assertion helpers of tests/base_view_test.py."""
+
+import pytest
+
+from tests.base_view_test import BaseSearchViewTest, BaseViewTest, create_sample_form_view
+
+FORM_ARCH = create_sample_form_view('res.partner', ['name', 'email', 'phone'])
+
+
+class TestAssertViewFieldsPresent:
+    """assert_view_fields_present checks several fields in one pass over the view."""
+
+    @pytest.mark.unit
+    def test_all_fields_present(self):
+        """Fields present in the view pass, in any order and with repeats."""
+        BaseViewTest().assert_view_fields_present(FORM_ARCH, ['phone', 'name', 'email', 'name'])
+
+    @pytest.mark.unit
+    def test_no_fields_to_check(self):
+        """An empty list of fields passes."""
+        BaseViewTest().assert_view_fields_present(FORM_ARCH, [])
+
+    @pytest.mark.unit
+    def test_missing_fields_are_listed(self):
+        """Every missing field is named in the message, in the order they were asked for."""
+        with pytest.raises(AssertionError, match="^Fields mobile, vat not found in view"):
+            BaseViewTest().assert_view_fields_present(FORM_ARCH, ['name', 'mobile', 'email', 'vat'])
+
+
+class TestAssertSearchGroupByPresent:
+    """assert_search_group_by_present matches the whole grouped field name."""
+
+    @staticmethod
+    def search_arch(context):
+        """A search view with one filter carrying the given context."""
+        return f'<search><filter name="group" context="{context}"/></search>'
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        'context',
+        ["{'group_by': 'state'}", "{'group_by':'state', 'default': 1}", '{&quot;group_by&quot;: &quot;state&quot;}'],
+    )
+    def test_group_by_present(self, context):
+        """The field is found however the context is quoted and spaced."""
+        BaseSearchViewTest().assert_search_group_by_present(self.search_arch(context), 'state')
+
+    @pytest.mark.unit
+    def test_field_name_prefix_does_not_match(self):
+        """Grouping by state_id is not grouping by state."""
+        arch = self.search_arch("{'group_by': 'state_id'}")
+
+        with pytest.raises(AssertionError, match="Group by state not found in search view"):
+            BaseSearchViewTest().assert_search_group_by_present(arch, 'state')
+        BaseSearchViewTest().assert_search_group_by_present(arch, 'state_id')
+
+
+class TestParseViewXml:
+    """View XML strings are parsed as the text they hold."""
+
+    @pytest.mark.unit
+    def test_encoding_declaration_does_not_change_text(self):
+        """A declared non-UTF-8 encoding doesn't re-decode the string's characters."""
+        xml_string = '<?xml version="1.0" encoding="ISO-8859-1"?><a>é</a>'
+
+        assert BaseViewTest().parse_view_xml(xml_string).text == 'é'
@@ -0,0 +1,96 @@
+"""Command-line tests for scripts/validate-security.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "validate-security.py"
+
+CSV_HEADER = "id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink\n"
+
+# Two rows, each with an invalid permission value
+INVALID_ACCESS_CSV = (
+    CSV_HEADER
+    + "access_demo_a,demo a,model_demo_a,base.group_user,1,yes,1,1\n"
+    + "access_demo_b,demo b,model_demo_b,base.group_user,1,1,maybe,1\n"
+)
+
+VALID_ACCESS_CSV = CSV_HEADER + "access_demo_a,demo a,model_demo_a,base.group_user,1,1,1,1\n"
+
+
+def write_module(root, access_csv):
+    """Create custom_modules/demo below root with the given access rights file."""
+    security_dir = root / "custom_modules" / "demo" / "security"
+    security_dir.mkdir(parents=True)
+    (security_dir / "ir.model.access.csv").write_text(access_csv, encoding="utf-8")
+
+
+def run_validator(cwd, *args):
+    """Run the script from cwd, where it looks for custom_modules."""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), *args], cwd=cwd, capture_output=True, text=True, encoding="utf-8"
+    )
+
+
+def reported_errors(stdout):
+    """The reported error lines, without the list of valid values (printed from a set, in no fixed order)."""
+    return [line.split(". Use:")[0] for line in stdout.splitlines() if line.lstrip().startswith("❌ custom_modules")]
+
+
+class TestFailFast:
+    """--fail-fast stops at the first error and still fails the run."""
+
+    @pytest.mark.unit
+    def test_all_errors_reported_without_fail_fast(self, tmp_path):
+        """Without --fail-fast every invalid row is reported."""
+        write_module(tmp_path, INVALID_ACCESS_CSV)
+
+        result = run_validator(tmp_path, "demo")
+
+        assert result.returncode == 1
+        assert "CRITICAL ERRORS (2)" in result.stdout
+        assert "'maybe'" in result.stdout
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("module_args", [("demo",), ()], ids=["one module", "all modules"])
+    def test_stops_at_first_error(self, tmp_path, module_args):
+        """Only the first error is collected, and the exit code is still 1."""
+        write_module(tmp_path, INVALID_ACCESS_CSV)
+
+        result = run_validator(tmp_path, "--fail-fast", *module_args)
+
+        assert result.returncode == 1
+        assert "CRITICAL ERRORS (1)" in result.stdout
+        assert "Invalid permission value 'yes' for perm_write" in result.stdout
+        assert "'maybe'" not in result.stdout
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "warm_args", [("--cache", "--fail-fast"), ("--cache",)], ids=["warmed by fail-fast", "warmed by full run"]
+    )
+    def test_cached_run_stops_like_cold_run(self, tmp_path, warm_args):
+        """A warm cache doesn't bring back the errors a cold --fail-fast run never reaches."""
+        write_module(tmp_path, INVALID_ACCESS_CSV)
+
+        cold = run_validator(tmp_path, "--cache", "--fail-fast", "demo")
+        run_validator(tmp_path, *warm_args, "demo")
+        cached = run_validator(tmp_path, "--cache", "--fail-fast", "demo")
+
+        assert (tmp_path / ".security_validation_cache.json").exists()
+        assert cached.returncode == cold.returncode == 1
+        assert reported_errors(cached.stdout) == reported_errors(cold.stdout)
+        assert len(reported_errors(cached.stdout)) == 1
+
+    @pytest.mark.unit
+    def test_passes_without_errors(self, tmp_path):
+        """A clean module exits 0 under --fail-fast."""
+        write_module(tmp_path, VALID_ACCESS_CSV)
+
+        result = run_validator(tmp_path, "--fail-fast", "demo")
+
+        assert result.returncode == 0
+        assert "ALL SECURITY VALIDATIONS PASSED" in result.stdout
+        # The results cache is opt-in
+        assert not (tmp_path / ".security_validation_cache.json").exists()
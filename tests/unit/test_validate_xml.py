@@ -0,0 +1,74 @@
+"""Unit tests for scripts/validate-xml.py."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "validate-xml.py"
+
+# The script's name is not importable, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("validate_xml", SCRIPT_PATH)
+assert spec is not None and spec.loader is not None
+validate_xml = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_xml)
+
+VIEWS_XML = """<?xml version="1.0" encoding="utf-8"?>
+<odoo>
+    <data>
+        <record id="local_form" model="ir.ui.view">
+            <field name="name">test.model.form</field>
+            <field name="model">test.model</field>
+            <field name="arch" type="xml">
+                <form><field name="name"/></form>
+            </field>
+        </record>
+        <record id="local_action" model="ir.actions.act_window">
+            <field name="name">Test</field>
+            <field name="res_model">test.model</field>
+            <field name="view_id" ref="local_form"/>
+            <field name="search_view_id" ref="missing_search"/>
+            <field name="company_id" ref="base.main_company"/>
+        </record>
+    </data>
+</odoo>
+"""
+
+
+@pytest.fixture
+def module_root(tmp_path):
+    """An addons directory holding one module with a resolved and an unresolved local ref."""
+    views_dir = tmp_path / "test_module" / "views"
+    views_dir.mkdir(parents=True)
+    (views_dir / "views.xml").write_text(VIEWS_XML, encoding="utf-8")
+    return tmp_path
+
+
+class TestValidateReferences:
+    """Field refs are checked against the XML ids the module declares."""
+
+    @pytest.mark.unit
+    def test_unresolved_local_ref_is_reported(self, module_root):
+        """Only the ref no file of the module declares is reported."""
+        validator = validate_xml.XMLValidator(str(module_root))
+
+        assert validator.validate_module_xml("test_module")
+
+        ref_warnings = [warning for warning in validator.warnings if "references" in warning]
+        assert len(ref_warnings) == 1
+        assert "Field 'search_view_id' references 'missing_search'" in ref_warnings[0]
+        assert not validator.errors
+
+    @pytest.mark.unit
+    def test_module_prefixed_local_ref_is_resolved(self, module_root):
+        """A ref qualified with the module's own name resolves against its unqualified ids."""
+        views_xml = module_root / "test_module" / "views" / "views.xml"
+        views_xml.write_text(
+            VIEWS_XML.replace('ref="missing_search"', 'ref="test_module.local_form"'), encoding="utf-8"
+        )
+        validator = validate_xml.XMLValidator(str(module_root))
+
+        assert validator.validate_module_xml("test_module")
+
+        assert not [warning for warning in validator.warnings if "references" in warning]
+        assert not validator.pending_refs